@@ -27,6 +27,7 @@ class AgentStatusMonitor:
         self.agents_file = self.comm_dir / "agents.json"
         self.tasks_file = self.comm_dir / "tasks.json"  
         self.messages_file = self.comm_dir / "messages.json"
+        self.message_dir = self.comm_dir / "messages"
     
     def load_json_file(self, file_path):
         """Safely load JSON file"""
@@ -47,8 +48,17 @@ class AgentStatusMonitor:
         return self.load_json_file(self.tasks_file)
     
     def get_messages(self):
-        """Get all messages"""
-        return self.load_json_file(self.messages_file)
+        """Get all messages, including those still in the per-recipient logs"""
+        messages = self.load_json_file(self.messages_file)
+        for log_file in sorted(self.message_dir.glob("*.log")):
+            try:
+                with open(log_file, 'r') as f:
+                    for line in f:
+                        if line.strip():
+                            messages.append(json.loads(line))
+            except (OSError, ValueError):
+                continue
+        return messages
     
     def display_status(self):
         """Display comprehensive system status"""
@@ -20,7 +20,7 @@ import subprocess
 
 # Import our Ollama client
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
-from src.core.ollama_client import ollama_client
+from src.core.ollama_client import get_ollama_client
 
 # === Enhanced Terminal Colors ===
 class Colors:
@@ -1258,7 +1258,7 @@ COLLABORATION NOTES:
         """Try to get AI implementation if model is available"""
         try:
             # Check if Ollama is available (local or remote)
-            if not ollama_client.is_available():
+            if not get_ollama_client().is_available():
                 return {"status": "unavailable", "message": "Ollama not available"}
             
             # Generate prompt for AI model
@@ -1274,13 +1274,13 @@ Requirements:
 Code:"""
             
             # Use the unified Ollama client
-            result = ollama_client.generate(prompt)
+            result = get_ollama_client().generate(prompt)
             
             if result['success']:
                 return {
                     "status": "success",
                     "implementation": result['response'],
-                    "model": ollama_client.default_model
+                    "model": get_ollama_client().default_model
                 }
             else:
                 return {"status": "error", "message": f"AI model execution failed: {result['error']}"}
@@ -2625,17 +2625,17 @@ Code:"""
         """Try to get AI implementation for file editing"""
         try:
             # Check if Ollama is available (local or remote)
-            if not ollama_client.is_available():
+            if not get_ollama_client().is_available():
                 return {"status": "unavailable", "message": "Ollama not available"}
             
             # Use the unified Ollama client
-            result = ollama_client.generate(prompt)
+            result = get_ollama_client().generate(prompt)
             
             if result['success']:
                 return {
                     "status": "success",
                     "implementation": result['response'],
-                    "model": ollama_client.default_model
+                    "model": get_ollama_client().default_model
                 }
             else:
                 return {"status": "error", "message": f"AI model execution failed: {result['error']}"}
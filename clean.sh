@@ -11,6 +11,7 @@ if [ -d ".agent_comm" ]; then
     echo "[]" > .agent_comm/agents.json
     echo "[]" > .agent_comm/tasks.json  
     echo "[]" > .agent_comm/messages.json
+    rm -f .agent_comm/messages.log .agent_comm/messages/*.log
     echo "Communication files cleaned"
 fi
 
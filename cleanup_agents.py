@@ -109,6 +109,17 @@ def clean_communication_files():
  print(f"ℹ{filename} not found")
  except Exception as e:
  print(f" Error cleaning {filename}: {e}")
+ 
+ # Messages not yet compacted into messages.json live in the per-recipient
+ # logs (and the older single messages.log); remove them or they reappear
+ for log_path in [comm_dir / "messages.log", *sorted((comm_dir / "messages").glob("*.log"))]:
+ log_name = log_path.relative_to(comm_dir)
+ try:
+ if log_path.exists():
+ log_path.unlink()
+ print(f" Cleaned {log_name}")
+ except Exception as e:
+ print(f" Error cleaning {log_name}: {e}")
 
 def kill_orphaned_processes():
  """Find and kill any orphaned multi_agent_terminal processes"""
@@ -7,11 +7,30 @@ and formats tasks exactly as the CoordinatorAgent expects them.
 """
 
 import re
-from typing import List, Dict, Any, Optional
+import sys
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from ..core.models import AgentRole, Task, TaskStatus
 from ..core.utils import colored_print, Colors
 
 
+# Interned keys for the task dicts walked by the display and command-building loops
+_K_ASSIGNED_TO = sys.intern('assigned_to')
+_K_DESCRIPTION = sys.intern('description')
+_K_TASK_TYPE = sys.intern('task_type')
+_K_ESTIMATED_TIME = sys.intern('estimated_time')
+_K_PRIORITY = sys.intern('priority')
+_K_FILE_STRUCTURE = sys.intern('file_structure')
+_K_PROJECT_TYPE = sys.intern('project_type')
+_K_TECHNOLOGIES = sys.intern('technologies')
+
+# Technology-specific coordinator instructions, in display order
+_TECH_INSTRUCTIONS = {
+    'react': "React components should follow modern hooks patterns",
+    'node.js': "Node.js development should use async/await patterns",
+    'fastapi': "FastAPI should include automatic OpenAPI documentation",
+}
+
+
 class HelperAgent:
     """
     Independent agent that decomposes tasks into actionable subtasks
@@ -1347,14 +1366,14 @@ class HelperAgent:
         task_counter = 1
         for phase in plan['execution_phases']:
             for task in phase['tasks']:
-                agent_name = task.get('assigned_to', task.get('assigned_agent', 'unknown'))
+                agent_name = task.get(_K_ASSIGNED_TO, task.get('assigned_agent', 'unknown'))
                 
                 colored_print(f"\n[{task_counter}] <{agent_name}>", Colors.BRIGHT_CYAN)
-                colored_print(f"    {task['description']}", Colors.WHITE)
-                colored_print(f"    Time: {task['estimated_time']} | Priority: {task['priority']}", Colors.CYAN)
+                colored_print(f"    {task[_K_DESCRIPTION]}", Colors.WHITE)
+                colored_print(f"    Time: {task[_K_ESTIMATED_TIME]} | Priority: {task[_K_PRIORITY]}", Colors.CYAN)
                 
                 # Add special instructions for coordinator understanding
-                task_type = task.get('task_type', 'general')
+                task_type = task.get(_K_TASK_TYPE, 'general')
                 if task_type == 'file_management':
                     colored_print(f"    File Operations Task", Colors.YELLOW)
                 elif task_type == 'code_generation':
@@ -1376,12 +1395,13 @@ class HelperAgent:
         colored_print(f"\nCOORDINATOR EXECUTION FORMAT:", Colors.BRIGHT_MAGENTA)
         colored_print("Copy these commands to coordinator terminal:", Colors.WHITE)
         
-        execution_commands = []
-        for i, phase in enumerate(plan['execution_phases']):
+        execution_commands = [None] * sum(len(phase['tasks']) for phase in plan['execution_phases'])
+        i = 0
+        for phase in plan['execution_phases']:
             for task in phase['tasks']:
-                agent = task.get('assigned_to', 'unknown')
-                cmd = f'delegate "{task["description"]}" to {agent}'
-                execution_commands.append(cmd)
+                agent = task.get(_K_ASSIGNED_TO, 'unknown')
+                execution_commands[i] = f'delegate "{task[_K_DESCRIPTION]}" to {agent}'
+                i += 1
         
         # Show first 3 commands as examples
         for i, cmd in enumerate(execution_commands[:3]):
@@ -1427,35 +1447,8 @@ class HelperAgent:
         colored_print(f"[HELPER] Generating coordinator commands...", Colors.MAGENTA)
         
         execution_plan = self.create_execution_plan(description)
-        
-        # Generate delegate commands
-        delegate_commands = []
-        file_structure_info = {}
-        
-        for task in execution_plan['subtasks']:
-            agent = task.get('assigned_to', 'unknown')
-            task_desc = task['description']
-            
-            # Format as coordinator delegate command
-            command = f'<{agent}> "{task_desc}"'
-            delegate_commands.append({
-                'command': command,
-                'agent': agent,
-                'description': task_desc,
-                'task_type': task.get('task_type', 'general'),
-                'estimated_time': task.get('estimated_time', '15-30 minutes'),
-                'priority': task.get('priority', 1)
-            })
-        
-        # Extract file structure information
-        if execution_plan.get('ai_consultation', {}).get('file_structure'):
-            ai_consultation = execution_plan['ai_consultation']
-            file_structure_info = {
-                'project_type': ai_consultation.get('project_type'),
-                'structure': ai_consultation.get('file_structure'),
-                'technologies': ai_consultation.get('technologies', []),
-                'setup_command': f'<file_manager> "Set up {ai_consultation.get("project_type", "project")} file structure with directories: {", ".join(ai_consultation.get("recommended_structure", []))}"'
-            }
+        delegate_commands = list(self._iter_delegate_commands(execution_plan['subtasks']))
+        file_structure_info = self._file_structure_info(execution_plan)
         
         coordinator_package = {
             'original_task': description,
@@ -1472,6 +1465,34 @@ class HelperAgent:
         
         return coordinator_package
 
+    @staticmethod
+    def _iter_delegate_commands(subtasks: List[Dict]) -> Iterator[Dict[str, Any]]:
+        """Yield the coordinator delegate command entry for each subtask"""
+        for task in subtasks:
+            agent = task.get(_K_ASSIGNED_TO, 'unknown')
+            task_desc = task[_K_DESCRIPTION]
+            yield {
+                'command': f'<{agent}> "{task_desc}"',
+                'agent': agent,
+                _K_DESCRIPTION: task_desc,
+                _K_TASK_TYPE: task.get(_K_TASK_TYPE, 'general'),
+                _K_ESTIMATED_TIME: task.get(_K_ESTIMATED_TIME, '15-30 minutes'),
+                _K_PRIORITY: task.get(_K_PRIORITY, 1)
+            }
+
+    @staticmethod
+    def _file_structure_info(execution_plan: Dict) -> Dict[str, Any]:
+        """File structure setup for the coordinator, or {} when the plan has none"""
+        ai_consultation = execution_plan.get('ai_consultation', {})
+        if not ai_consultation.get(_K_FILE_STRUCTURE):
+            return {}
+        return {
+            _K_PROJECT_TYPE: ai_consultation.get(_K_PROJECT_TYPE),
+            'structure': ai_consultation.get(_K_FILE_STRUCTURE),
+            _K_TECHNOLOGIES: ai_consultation.get(_K_TECHNOLOGIES, []),
+            'setup_command': f'<file_manager> "Set up {ai_consultation.get(_K_PROJECT_TYPE, "project")} file structure with directories: {", ".join(ai_consultation.get("recommended_structure", []))}"'
+        }
+
     def _generate_coordinator_instructions(self, execution_plan: Dict) -> List[str]:
         """Generate specific instructions for the coordinator to understand the plan."""
         instructions = []
@@ -1516,55 +1537,68 @@ class HelperAgent:
             ])
         
         # Add technology-specific instructions
-        technologies = ai_info.get('technologies', [])
-        if 'react' in technologies:
-            instructions.append("React components should follow modern hooks patterns")
-        if 'node.js' in technologies:
-            instructions.append("Node.js development should use async/await patterns")
-        if 'fastapi' in technologies:
-            instructions.append("FastAPI should include automatic OpenAPI documentation")
+        tech_set = set(ai_info.get('technologies', []))
+        if tech_set & _TECH_INSTRUCTIONS.keys():
+            instructions.extend(
+                instruction for tech, instruction in _TECH_INSTRUCTIONS.items() if tech in tech_set
+            )
         
         return instructions
 
     def print_coordinator_commands(self, description: str):
         """Print copy-paste ready commands for coordinator execution."""
-        coordinator_package = self.generate_coordinator_commands(description)
+        sys.stdout.writelines(
+            f"{color}{text}{Colors.ENDC}\n"
+            for color, text in self._iter_coordinator_output(description)
+        )
+    
+    def _iter_coordinator_output(self, description: str) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (color, text) lines for the coordinator commands as the plan is walked.
+        
+        Renders the same entries as generate_coordinator_commands without
+        materializing the package.
+        """
+        yield Colors.MAGENTA, "[HELPER] Generating coordinator commands..."
+        
+        execution_plan = self.create_execution_plan(description)
         
-        colored_print(f"\n{'='*60}", Colors.BRIGHT_GREEN)
-        colored_print(f"COORDINATOR COPY-PASTE COMMANDS", Colors.BRIGHT_GREEN)
-        colored_print(f"{'='*60}", Colors.BRIGHT_GREEN)
+        yield Colors.BRIGHT_GREEN, f"\n{'='*60}"
+        yield Colors.BRIGHT_GREEN, "COORDINATOR COPY-PASTE COMMANDS"
+        yield Colors.BRIGHT_GREEN, f"{'='*60}"
         
-        colored_print(f"\nOriginal Task: {coordinator_package['original_task']}", Colors.CYAN)
+        yield Colors.CYAN, f"\nOriginal Task: {description}"
         
         # File structure setup (if applicable)
-        if coordinator_package['file_structure']:
-            fs_info = coordinator_package['file_structure']
-            colored_print(f"\nSTEP 1: FILE STRUCTURE SETUP", Colors.BRIGHT_YELLOW)
-            colored_print(f"{fs_info['setup_command']}", Colors.WHITE)
-            colored_print(f"Project Type: {fs_info['project_type']}", Colors.CYAN)
-            colored_print(f"Technologies: {', '.join(fs_info['technologies'])}", Colors.CYAN)
+        fs_info = self._file_structure_info(execution_plan)
+        if fs_info:
+            yield Colors.BRIGHT_YELLOW, "\nSTEP 1: FILE STRUCTURE SETUP"
+            yield Colors.WHITE, fs_info['setup_command']
+            yield Colors.CYAN, f"Project Type: {fs_info[_K_PROJECT_TYPE]}"
+            yield Colors.CYAN, f"Technologies: {', '.join(fs_info[_K_TECHNOLOGIES])}"
         
         # Delegate commands
-        colored_print(f"\nSTEP 2: TASK DELEGATION COMMANDS", Colors.BRIGHT_YELLOW)
-        for i, cmd in enumerate(coordinator_package['delegate_commands'], 1):
-            colored_print(f"\n[{i}] {cmd['command']}", Colors.WHITE)
-            colored_print(f"    Type: {cmd['task_type']} | Time: {cmd['estimated_time']}", Colors.CYAN)
+        yield Colors.BRIGHT_YELLOW, "\nSTEP 2: TASK DELEGATION COMMANDS"
+        agents_involved = {}
+        for i, cmd in enumerate(self._iter_delegate_commands(execution_plan['subtasks']), 1):
+            agents_involved[cmd['agent']] = None
+            yield Colors.WHITE, f"\n[{i}] {cmd['command']}"
+            yield Colors.CYAN, f"    Type: {cmd[_K_TASK_TYPE]} | Time: {cmd[_K_ESTIMATED_TIME]}"
         
         # Coordinator instructions
-        colored_print(f"\nCOORDINATOR EXECUTION NOTES:", Colors.BRIGHT_MAGENTA)
-        for instruction in coordinator_package['coordinator_instructions']:
-            colored_print(f"  • {instruction}", Colors.WHITE)
+        yield Colors.BRIGHT_MAGENTA, "\nCOORDINATOR EXECUTION NOTES:"
+        for instruction in self._generate_coordinator_instructions(execution_plan):
+            yield Colors.WHITE, f"  • {instruction}"
         
         # Summary
-        summary = coordinator_package['execution_summary']
-        colored_print(f"\nEXECUTION SUMMARY:", Colors.YELLOW)
-        colored_print(f"  Total Tasks: {summary['total_tasks']}", Colors.WHITE)
-        colored_print(f"  Duration: {summary['estimated_duration']}", Colors.WHITE)
-        colored_print(f"  Agents: {', '.join(summary['agents_involved'])}", Colors.WHITE)
-        
-        colored_print(f"\n{'='*60}", Colors.BRIGHT_GREEN)
-        colored_print(f"READY FOR COORDINATOR EXECUTION!", Colors.BRIGHT_GREEN)
-        colored_print(f"{'='*60}\n", Colors.BRIGHT_GREEN)
+        yield Colors.YELLOW, "\nEXECUTION SUMMARY:"
+        yield Colors.WHITE, f"  Total Tasks: {len(execution_plan['subtasks'])}"
+        yield Colors.WHITE, f"  Duration: {execution_plan['estimated_duration']}"
+        yield Colors.WHITE, f"  Agents: {', '.join(agents_involved)}"
+        
+        yield Colors.BRIGHT_GREEN, f"\n{'='*60}"
+        yield Colors.BRIGHT_GREEN, "READY FOR COORDINATOR EXECUTION!"
+        yield Colors.BRIGHT_GREEN, f"{'='*60}\n"
     
     def _infer_precise_task_type(self, description: str) -> str:
         """Infer precise task type from enhanced description"""
@@ -2,31 +2,143 @@
 Base Agent Class - Framework-agnostic agent foundation with standardized interface
 """
 
+import asyncio
+import atexit
+import io
+import logging
 import os
 import json
+import queue
+import shutil
+import string
+import sys
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Mapping, Optional, Tuple, Union
 from datetime import datetime
+from functools import lru_cache, partial
+from types import MappingProxyType
+try:
+    import orjson  # type: ignore
+except Exception:  # Fallback to the stdlib json module if orjson isn't installed
+    orjson = None  # type: ignore
 
 from .models import AgentRole, TaskStatus, Colors
-from .utils import colored_print, gather_file_context, gather_directory_context, gather_project_context
+from .utils import (
+    colored_print, gather_file_context, gather_directory_context, gather_project_context,
+    read_utf8_text, FILE_PREVIEW_CHARS)
 from .communication import AgentCommunication
-from .ollama_client import ollama_client
+from .ollama_client import get_ollama_client
+
+
+# Shared by all agents so context gathering doesn't spin up threads per task
+_CONTEXT_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="agent-context")
+
+# Per-file and per-message detail lines from busy agent code paths go through
+# a queue so the terminal writes happen on a background thread, started when
+# the first line is logged. Status lines (task start and end, AI calls, errors)
+# use colored_print so they stay in order with subclass output and prompts
+_log = logging.getLogger('multi_agent')
+_LOG_LISTENER_LOCK = threading.Lock()
+
+
+class _ColorFormatter(logging.Formatter):
+    """Wrap log messages in the color passed with the record"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return f"{getattr(record, 'color', '')}{record.getMessage()}{Colors.ENDC}"
+
+
+def _start_log_listener() -> None:
+    """Attach the queued stdout handler to the agent logger once per process"""
+    with _LOG_LISTENER_LOCK:
+        if _log.handlers:
+            return
+        log_queue: 'queue.SimpleQueue' = queue.SimpleQueue()
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(_ColorFormatter())
+        listener = QueueListener(log_queue, stream_handler)
+        listener.start()
+        atexit.register(listener.stop)
+        _log.addHandler(QueueHandler(log_queue))
+        _log.setLevel(logging.INFO)
+        _log.propagate = False
+
+
+def _log_colored(text: str, color: str) -> None:
+    """Queued counterpart of colored_print for detail lines"""
+    if not _log.handlers:
+        _start_log_listener()
+    _log.info(text, extra={'color': color})
+
+
+# Most file contexts kept by BaseAgent's shared cache
+_FILE_CONTEXT_CACHE_SIZE = 256
+
+# Largest slice handed to a single os.write call
+_WRITE_CHUNK_SIZE = 1024 * 1024
+
+# Bounds how many AI operations agents awaiting aexecute_ai_operation run at once
+_AI_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="agent-ai")
+
+_FORMATTER = string.Formatter()
+
+
+@lru_cache(maxsize=256)
+def _compile_template(template: str) -> Optional[Tuple[Tuple[str, Optional[str], str, Optional[str]], ...]]:
+    """Parse a format template once; None if it needs str.format's full handling"""
+    tokens = tuple(_FORMATTER.parse(template))
+    for _, field_name, format_spec, _ in tokens:
+        # Positional fields and nested replacement fields in format specs
+        # are left to str.format
+        if field_name is not None and (
+                not field_name or field_name[0].isdigit() or '{' in format_spec):
+            return None
+    return tokens
+
+
+def _render_template(template: str, variables: Dict[str, Any]) -> str:
+    """Equivalent of template.format(**variables) using the cached parse"""
+    tokens = _compile_template(template)
+    if tokens is None:
+        return template.format(**variables)
+
+    parts = []
+    for literal, field_name, format_spec, conversion in tokens:
+        parts.append(literal)
+        if field_name is not None:
+            value, _ = _FORMATTER.get_field(field_name, (), variables)
+            value = _FORMATTER.convert_field(value, conversion)
+            parts.append(format(value, format_spec))
+    return ''.join(parts)
 
 
 class TaskInput:
     """Standardized task input container for flexible parameter handling"""
 
+    __slots__ = (
+        'description', 'task_type', 'priority', 'metadata', '_files_raw',
+        '_files', '_directories_raw', '_directories', 'text_inputs',
+        'target_file', 'target_directory', 'context', 'constraints',
+        'requirements', 'ai_prompt_template', 'ai_model_preferences',
+        '_bullet_cache')
+
     def __init__(self, task_description: str, **kwargs):
         self.description = task_description
         self.task_type = kwargs.get('task_type', 'general')
         self.priority = kwargs.get('priority', 1)
         self.metadata = kwargs.get('metadata', {})
 
-        # Input parameters (files, directories, text)
-        self.files = self._normalize_paths(kwargs.get('files', []))
-        self.directories = self._normalize_paths(kwargs.get('directories', []))
+        # Input parameters (files, directories, text); paths are only
+        # converted to Path objects when first accessed
+        self._files_raw = kwargs.get('files', [])
+        self._files = None
+        self._directories_raw = kwargs.get('directories', [])
+        self._directories = None
         self.text_inputs = kwargs.get('text_inputs', [])
         self.target_file = kwargs.get('target_file')
         self.target_directory = kwargs.get('target_directory')
@@ -40,17 +152,59 @@ class TaskInput:
         self.ai_prompt_template = kwargs.get('ai_prompt_template')
         self.ai_model_preferences = kwargs.get('ai_model_preferences', {})
 
+        # Prompt bullet lists, reused while the source list is unchanged
+        self._bullet_cache = {}
+
+    @property
+    def files(self) -> List[Path]:
+        """File inputs as Path objects"""
+        if self._files is None:
+            self._files = self._normalize_paths(self._files_raw)
+        return self._files
+
+    @property
+    def directories(self) -> List[Path]:
+        """Directory inputs as Path objects"""
+        if self._directories is None:
+            self._directories = self._normalize_paths(self._directories_raw)
+        return self._directories
+
+    @property
+    def formatted_text_inputs(self) -> str:
+        """Text inputs as a prompt bullet list"""
+        return self._bullet_block('text_inputs')
+
+    @property
+    def formatted_requirements(self) -> str:
+        """Requirements as a prompt bullet list"""
+        return self._bullet_block('requirements')
+
+    @property
+    def formatted_constraints(self) -> str:
+        """Constraints as a prompt bullet list"""
+        return self._bullet_block('constraints')
+
+    def _bullet_block(self, name: str) -> str:
+        """Format a list attribute as '- item' lines, cached until the list is replaced or resized"""
+        items = getattr(self, name)
+        cached = self._bullet_cache.get(name)
+        if cached is not None and cached[0] is items and cached[1] == len(items):
+            return cached[2]
+        text = "\n".join(f"- {item}" for item in items)
+        self._bullet_cache[name] = (items, len(items), text)
+        return text
+
     def _normalize_paths(self, paths: List[Union[str, Path]]) -> List[Path]:
         """Normalize path inputs to Path objects"""
-        return [Path(p) for p in paths]
+        return [p if isinstance(p, Path) else Path(p) for p in paths]
 
     def has_files(self) -> bool:
         """Check if task has file inputs"""
-        return len(self.files) > 0
+        return len(self._files_raw) > 0
 
     def has_directories(self) -> bool:
         """Check if task has directory inputs"""
-        return len(self.directories) > 0
+        return len(self._directories_raw) > 0
 
     def has_text_inputs(self) -> bool:
         """Check if task has text inputs"""
@@ -73,6 +227,10 @@ class TaskInput:
 class TaskResult:
     """Standardized task result container"""
 
+    __slots__ = (
+        'success', 'message', 'data', 'files_created', 'files_modified',
+        'output_content', 'delegated_tasks', 'metadata', 'timestamp')
+
     def __init__(self, success: bool, **kwargs):
         self.success = success
         self.message = kwargs.get('message', '')
@@ -84,9 +242,9 @@ class TaskResult:
         self.metadata = kwargs.get('metadata', {})
         self.timestamp = datetime.now().isoformat()
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert result to dictionary"""
-        return {
+    def to_dict(self, compact: bool = False) -> Dict[str, Any]:
+        """Convert result to dictionary; compact=True omits empty fields"""
+        result = {
             'success': self.success,
             'message': self.message,
             'data': self.data,
@@ -97,6 +255,29 @@ class TaskResult:
             'metadata': self.metadata,
             'timestamp': self.timestamp
         }
+        if compact:
+            # success is kept even when False
+            return {
+                key: value for key, value in result.items()
+                if value or key == 'success'}
+        return result
+
+    def to_json_bytes(self, slim: bool = False) -> bytes:
+        """Serialize result to JSON bytes; slim=True drops empty fields"""
+        result = self.to_dict(compact=slim)
+        if orjson is not None:
+            return orjson.dumps(result, default=str)
+        return json.dumps(result, default=str).encode('utf-8')
+
+    @classmethod
+    def from_json_bytes(cls, data: Union[bytes, str]) -> 'TaskResult':
+        """Rebuild a result serialized with to_json_bytes"""
+        fields = orjson.loads(data) if orjson is not None else json.loads(data)
+        timestamp = fields.pop('timestamp', None)
+        result = cls(fields.pop('success', False), **fields)
+        if timestamp:
+            result.timestamp = timestamp
+        return result
 
 
 class BaseAgent(ABC):
@@ -105,6 +286,21 @@ class BaseAgent(ABC):
     communication capabilities, and AI integration.
     """
 
+    # File contexts shared by all agents in the process, keyed by
+    # (path, mtime_ns, size, max_context_size) and kept in LRU order
+    _file_context_cache: 'OrderedDict[tuple, Dict[str, Any]]' = OrderedDict()
+    _file_context_lock = threading.Lock()
+
+    # Closing block shared by every standardized prompt
+    _PROMPT_INSTRUCTIONS = (
+        "INSTRUCTIONS:\n"
+        "- Provide practical, executable solutions\n"
+        "- Be framework-agnostic unless context indicates specific framework\n"
+        "- Include proper error handling and validation\n"
+        "- Follow best practices for the detected technology stack\n"
+        "- Generate complete, working implementations\n"
+    )
+
     def __init__(
             self,
             agent_id: str,
@@ -115,16 +311,20 @@ class BaseAgent(ABC):
         self.role = role
         self.workspace_dir = Path(workspace_dir)
 
+        # First prompt line, fixed for the agent's lifetime
+        self._prompt_header = f"AGENT ROLE: {role.value.upper()}\n"
+
         # Communication system
         self.comm = AgentCommunication(workspace_dir)
 
         # AI client integration
-        self.ai_client = ollama_client
+        self.ai_client = get_ollama_client()
         self.default_model = kwargs.get('default_model', 'llama3.2')
 
         # Agent configuration
         self.capabilities = self._define_capabilities()
-        self.supported_file_types = self._define_supported_file_types()
+        # Hashed once so per-file suffix checks are constant time
+        self.supported_file_types = frozenset(self._define_supported_file_types())
         self.framework_adapters = {}
 
         # Task execution settings
@@ -176,18 +376,10 @@ class BaseAgent(ABC):
         """
         Main task execution entry point - standardized across all agents
         """
-        # Log task execution
-        colored_print(f"{self.agent_id}: Executing task", Colors.CYAN)
-        colored_print(f" {task_input.description}", Colors.WHITE)
-
         try:
-            # Pre-execution validation
-            if not self.can_handle_task(task_input):
-                return TaskResult(
-                    success=False,
-                    message=f"Agent {self.agent_id} cannot handle this task type or file types",
-                    metadata={
-                        'validation_failed': True})
+            rejected = self._begin_task(task_input)
+            if rejected is not None:
+                return rejected
 
             # Gather context from inputs
             context = self._gather_input_context(task_input)
@@ -195,20 +387,78 @@ class BaseAgent(ABC):
             # Execute the specific task (implemented by subclasses)
             result = self._execute_specific_task(task_input, context)
 
-            # Post-execution processing
-            self._post_process_result(task_input, result)
+            return self._finish_task(task_input, result)
 
-            return result
+        except Exception as e:
+            return self._task_failed(e)
+
+    async def aexecute_task(self, task_input: TaskInput) -> TaskResult:
+        """
+        Async counterpart of execute_task so an orchestrator can run many agents concurrently
+        """
+        try:
+            rejected = self._begin_task(task_input)
+            if rejected is not None:
+                return rejected
+
+            loop = asyncio.get_running_loop()
+            context = await loop.run_in_executor(
+                None, self._gather_input_context, task_input)
+
+            result = await self._aexecute_specific_task(task_input, context)
+
+            return self._finish_task(task_input, result)
 
         except Exception as e:
-            colored_print(
-                f" {self.agent_id}: Task execution failed: {e}",
-                Colors.RED)
+            return self._task_failed(e)
+
+    def _begin_task(self, task_input: TaskInput) -> Optional[TaskResult]:
+        """Log the task and validate it; returns the rejection if this agent can't handle it"""
+        colored_print(f"{self.agent_id}: Executing task", Colors.CYAN)
+        colored_print(f" {task_input.description}", Colors.WHITE)
+
+        # Pre-execution validation
+        if not self.can_handle_task(task_input):
             return TaskResult(
                 success=False,
-                message=f"Task execution failed: {str(e)}",
-                metadata={'exception': str(e)}
-            )
+                message=f"Agent {self.agent_id} cannot handle this task type or file types",
+                metadata={
+                    'validation_failed': True})
+        return None
+
+    def _finish_task(self, task_input: TaskInput, result: TaskResult) -> TaskResult:
+        """Post-execution processing shared by execute_task and aexecute_task"""
+        self._post_process_result(task_input, result)
+        return result
+
+    def _task_failed(self, e: Exception) -> TaskResult:
+        """Report a task that raised and turn it into a failed result"""
+        colored_print(
+            f" {self.agent_id}: Task execution failed: {e}",
+            Colors.RED)
+        return TaskResult(
+            success=False,
+            message=f"Task execution failed: {str(e)}",
+            metadata={'exception': str(e)}
+        )
+
+    @classmethod
+    async def execute_many_async(
+            cls,
+            pairs: List[Tuple['BaseAgent', TaskInput]],
+            max_parallel: int = 8) -> List[TaskResult]:
+        """
+        Run (agent, task) pairs concurrently, at most max_parallel at a time.
+        Results are returned in input order.
+        """
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def run(agent: 'BaseAgent', task_input: TaskInput) -> TaskResult:
+            async with semaphore:
+                return await agent.aexecute_task(task_input)
+
+        return list(await asyncio.gather(
+            *(run(agent, task_input) for agent, task_input in pairs)))
 
     @abstractmethod
     def _execute_specific_task(
@@ -218,6 +468,15 @@ class BaseAgent(ABC):
         """Execute the agent-specific task logic - must be implemented by subclasses"""
         pass
 
+    async def _aexecute_specific_task(
+            self,
+            task_input: TaskInput,
+            context: Dict) -> TaskResult:
+        """Run the agent-specific task logic off the event loop - can be overridden with native async code"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self._execute_specific_task, task_input, context)
+
     def _gather_input_context(self, task_input: TaskInput) -> Dict[str, Any]:
         """Gather context from all input sources"""
         context = {
@@ -228,16 +487,19 @@ class BaseAgent(ABC):
             'total_size': 0
         }
 
+        # Scan directories in the background while the files are read;
+        # map keeps input order
+        dir_contexts = _CONTEXT_POOL.map(
+            gather_directory_context, task_input.directories)
+        file_contexts = self._gather_file_contexts(task_input.files)
+
         # Gather file contexts
-        for file_path in task_input.files:
-            file_context = gather_file_context(
-                file_path, self.max_context_size)
+        for file_path, file_context in zip(task_input.files, file_contexts):
             context['files'][str(file_path)] = file_context
             context['total_size'] += file_context.get('size', 0)
 
         # Gather directory contexts
-        for dir_path in task_input.directories:
-            dir_context = gather_directory_context(dir_path)
+        for dir_path, dir_context in zip(task_input.directories, dir_contexts):
             context['directories'][str(dir_path)] = dir_context
 
         # Gather project context if in a project
@@ -247,6 +509,39 @@ class BaseAgent(ABC):
 
         return context
 
+    def _gather_file_contexts(self, files: List[Path]) -> List[Dict[str, Any]]:
+        """File contexts in input order, reusing cached ones while the files are unchanged"""
+        lookups = list(_CONTEXT_POOL.map(self._lookup_file_context, files))
+        misses = [i for i, (_, cached) in enumerate(lookups) if cached is None]
+        gather = partial(gather_file_context, max_size=self.max_context_size)
+        computed = _CONTEXT_POOL.map(gather, [files[i] for i in misses])
+
+        results = [cached for _, cached in lookups]
+        for i, file_context in zip(misses, computed):
+            key = lookups[i][0]
+            if key is not None and 'error' not in file_context:
+                with BaseAgent._file_context_lock:
+                    BaseAgent._file_context_cache[key] = file_context
+                    if len(BaseAgent._file_context_cache) > _FILE_CONTEXT_CACHE_SIZE:
+                        BaseAgent._file_context_cache.popitem(last=False)
+            results[i] = dict(file_context)
+        return results
+
+    def _lookup_file_context(self, file_path: Path) -> Tuple[Optional[tuple], Optional[Dict[str, Any]]]:
+        """Return the file's cache key and a copy of its cached context, if any"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None, None
+
+        key = (os.fspath(file_path), stat.st_mtime_ns, stat.st_size, self.max_context_size)
+        with BaseAgent._file_context_lock:
+            cached = BaseAgent._file_context_cache.get(key)
+            if cached is None:
+                return key, None
+            BaseAgent._file_context_cache.move_to_end(key)
+            return key, dict(cached)
+
     def _post_process_result(
             self,
             task_input: TaskInput,
@@ -275,80 +570,52 @@ class BaseAgent(ABC):
                 task_input.ai_prompt_template, task_input, context)
 
         # Build standardized prompt
-        prompt_parts = [
-            f"AGENT ROLE: {self.role.value.upper()}",
-            f"OPERATION: {operation_type or 'GENERAL_TASK'}",
-            "",
-            f"TASK DESCRIPTION:",
-            task_input.description,
-            ""
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        w(self._prompt_header)
+        w(f"OPERATION: {operation_type or 'GENERAL_TASK'}\n\n")
+        w("TASK DESCRIPTION:\n")
+        w(f"{task_input.description}\n\n")
 
         # Add context sections
         if context.get('project_context'):
-            prompt_parts.extend([
-                "PROJECT CONTEXT:",
-                self._format_project_context(context['project_context']),
-                ""
-            ])
+            w("PROJECT CONTEXT:\n")
+            w(f"{self._format_project_context(context['project_context'])}\n\n")
 
         if context.get('files'):
-            prompt_parts.extend([
-                "INPUT FILES:",
-                self._format_files_context(context['files']),
-                ""
-            ])
+            w("INPUT FILES:\n")
+            w(f"{self._format_files_context(context['files'])}\n\n")
 
         if context.get('directories'):
-            prompt_parts.extend([
-                "INPUT DIRECTORIES:",
-                self._format_directories_context(context['directories']),
-                ""
-            ])
+            w("INPUT DIRECTORIES:\n")
+            w(f"{self._format_directories_context(context['directories'])}\n\n")
 
         if task_input.text_inputs:
-            prompt_parts.extend([
-                "TEXT INPUTS:",
-                "\n".join(f"- {text}" for text in task_input.text_inputs),
-                ""
-            ])
+            w("TEXT INPUTS:\n")
+            w(task_input.formatted_text_inputs)
+            w("\n\n")
 
         # Add requirements and constraints
         if task_input.requirements:
-            prompt_parts.extend([
-                "REQUIREMENTS:",
-                "\n".join(f"- {req}" for req in task_input.requirements),
-                ""
-            ])
+            w("REQUIREMENTS:\n")
+            w(task_input.formatted_requirements)
+            w("\n\n")
 
         if task_input.constraints:
-            prompt_parts.extend(["CONSTRAINTS:", "\n".join(
-                f"- {constraint}" for constraint in task_input.constraints), ""])
+            w("CONSTRAINTS:\n")
+            w(task_input.formatted_constraints)
+            w("\n\n")
 
         # Add target information
         if task_input.target_file:
-            prompt_parts.extend([
-                f"TARGET FILE: {task_input.target_file}",
-                ""
-            ])
+            w(f"TARGET FILE: {task_input.target_file}\n\n")
 
         if task_input.target_directory:
-            prompt_parts.extend([
-                f"TARGET DIRECTORY: {task_input.target_directory}",
-                ""
-            ])
-
-        prompt_parts.extend([
-            "INSTRUCTIONS:",
-            "- Provide practical, executable solutions",
-            "- Be framework-agnostic unless context indicates specific framework",
-            "- Include proper error handling and validation",
-            "- Follow best practices for the detected technology stack",
-            "- Generate complete, working implementations",
-            ""
-        ])
-
-        return "\n".join(prompt_parts)
+            w(f"TARGET DIRECTORY: {task_input.target_directory}\n\n")
+
+        w(self._PROMPT_INSTRUCTIONS)
+
+        return buf.getvalue()
 
     def _apply_prompt_template(
             self,
@@ -366,7 +633,7 @@ class BaseAgent(ABC):
         }
 
         try:
-            return template.format(**variables)
+            return _render_template(template, variables)
         except KeyError as e:
             colored_print(f" Template variable missing: {e}", Colors.YELLOW)
             return template
@@ -394,14 +661,20 @@ class BaseAgent(ABC):
             if file_data.get('error'):
                 lines.append(f"- {file_path}: {file_data['error']}")
             elif file_data.get('readable'):
-                content = file_data.get('content', '')
+                preview = file_data.get('preview')
+                if preview is None:
+                    content = file_data.get('content', '')
+                    preview = content[:FILE_PREVIEW_CHARS]
+                    truncated = len(content) > FILE_PREVIEW_CHARS
+                else:
+                    truncated = file_data.get('content_truncated', False)
                 size_info = file_data.get('size_formatted', 'unknown size')
                 lines.append(f"- {file_path} ({size_info})")
-                if len(content) > 1000:
+                if truncated:
                     lines.append(
-                        f" Content preview: {content[:1000]}...[truncated]")
+                        f" Content preview: {preview}...[truncated]")
                 else:
-                    lines.append(f" Content: {content}")
+                    lines.append(f" Content: {preview}")
             else:
                 lines.append(f"- {file_path}: Binary or unreadable file")
         return "\n".join(lines)
@@ -465,6 +738,15 @@ class BaseAgent(ABC):
                 'response': ''
             }
 
+    async def aexecute_ai_operation(
+            self, prompt: str, model: str = None) -> Dict[str, Any]:
+        """
+        Async counterpart of execute_ai_operation; at most four AI calls run at once
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _AI_POOL, self.execute_ai_operation, prompt, model)
+
     def _ai_fallback_response(self, prompt: str) -> Dict[str, Any]:
         """Provide fallback response when AI is unavailable - can be overridden"""
         return {
@@ -501,7 +783,7 @@ class BaseAgent(ABC):
             target_agent,
             message,
             message_type)
-        colored_print(
+        _log_colored(
             f" {self.agent_id} → {target_agent}: {message}",
             Colors.CYAN)
 
@@ -509,33 +791,67 @@ class BaseAgent(ABC):
                    file_path: Union[str,
                                     Path],
                    content: str,
-                   backup: bool = True) -> bool:
+                   backup: bool = True,
+                   durable: bool = False) -> bool:
         """
-        Write content to file with backup support
+        Write content to file with backup support; durable=True syncs it to disk
         """
         file_path = Path(file_path)
+        # Private to this process and thread, so concurrent writers of the same
+        # target (or a user file named <name>.tmp) are never clobbered
+        tmp_path = file_path.with_name(
+            f".{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
 
         try:
-            # Create backup if requested and file exists
-            if backup and file_path.exists():
-                backup_path = file_path.with_suffix(
-                    f"{file_path.suffix}.backup")
-                file_path.rename(backup_path)
-                colored_print(f" Created backup: {backup_path}", Colors.CYAN)
-
             # Ensure parent directory exists
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write content
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-            colored_print(
+            # Write the new content next to the target first, encoded once and
+            # passed to the OS in large chunks
+            if os.linesep != '\n':
+                content = content.replace('\n', os.linesep)
+            data = memoryview(content.encode('utf-8'))
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+            try:
+                offset = 0
+                while offset < len(data):
+                    offset += os.write(fd, data[offset:offset + _WRITE_CHUNK_SIZE])
+                if durable:
+                    getattr(os, 'fdatasync', os.fsync)(fd)
+            finally:
+                os.close(fd)
+
+            if file_path.exists():
+                # Keep the permissions of the file being replaced
+                shutil.copymode(file_path, tmp_path)
+
+                # Create backup if requested; a hard link snapshots the old
+                # content without copying it
+                if backup:
+                    backup_path = file_path.with_suffix(
+                        f"{file_path.suffix}.backup")
+                    if backup_path.exists():
+                        backup_path.unlink()
+                    try:
+                        os.link(file_path, backup_path)
+                    except OSError:
+                        shutil.copy2(file_path, backup_path)
+                    _log_colored(f" Created backup: {backup_path}", Colors.CYAN)
+
+            # Atomically swap in the new content; readers never see a missing
+            # or partially written file
+            os.replace(tmp_path, file_path)
+
+            _log_colored(
                 f" {self.agent_id}: Wrote file {file_path}",
                 Colors.GREEN)
             return True
 
         except Exception as e:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
             colored_print(
                 f" Failed to write file {file_path}: {e}",
                 Colors.RED)
@@ -544,8 +860,10 @@ class BaseAgent(ABC):
     def read_file(self, file_path: Union[str, Path]) -> Optional[str]:
         """Read file content with error handling"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            # One buffered read for every size: a mapping of a file that is
+            # truncated while it is read (editors, formatters and other agents
+            # rewrite files in place) raises SIGBUS, which can't be caught
+            return read_utf8_text(Path(file_path))
         except Exception as e:
             colored_print(f" Failed to read file {file_path}: {e}", Colors.RED)
             return None
@@ -561,6 +879,76 @@ class BaseAgent(ABC):
 
 
 # Framework detection utilities
+
+# Conventions per framework; read-only so the shared values can be returned directly
+_FRAMEWORK_CONVENTIONS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    'react': MappingProxyType({
+        'file_extensions': ('.jsx', '.tsx', '.js', '.ts'),
+        'component_naming': 'PascalCase',
+        'directory_structure': ('src', 'components', 'hooks', 'utils'),
+        'import_style': 'es6'
+    }),
+    'vue': MappingProxyType({
+        'file_extensions': ('.vue', '.js', '.ts'),
+        'component_naming': 'PascalCase',
+        'directory_structure': ('src', 'components', 'views', 'store'),
+        'import_style': 'es6'
+    }),
+    'python': MappingProxyType({
+        'file_extensions': ('.py',),
+        'naming_convention': 'snake_case',
+        'directory_structure': ('src', 'tests', 'docs'),
+        'import_style': 'python'
+    }),
+    'flask': MappingProxyType({
+        'file_extensions': ('.py',),
+        'naming_convention': 'snake_case',
+        'directory_structure': ('app', 'templates', 'static', 'tests'),
+        'import_style': 'python'
+    })
+})
+
+_DEFAULT_CONVENTIONS: Mapping[str, Any] = MappingProxyType({
+    'file_extensions': ('.txt',),
+    'naming_convention': 'unknown',
+    'directory_structure': (),
+    'import_style': 'unknown'
+})
+
+
+@lru_cache(maxsize=256)
+def _framework_from_dependencies(project_type: str, deps: tuple) -> str:
+    """Map a project type and its sorted dependency names to a framework"""
+    # JavaScript/Node.js framework detection (exact package names)
+    if project_type == 'javascript/node':
+        deps = frozenset(deps)
+        if 'react' in deps:
+            return 'react'
+        elif 'vue' in deps:
+            return 'vue'
+        elif 'angular' in deps:
+            return 'angular'
+        elif 'express' in deps:
+            return 'express'
+        else:
+            return 'javascript'
+
+    # Python framework detection (requirement specifiers, matched by substring);
+    # lowercase and join once so each check is a single scan
+    elif project_type == 'python':
+        joined = '|'.join(deps).lower()
+        if 'flask' in joined:
+            return 'flask'
+        elif 'django' in joined:
+            return 'django'
+        elif 'fastapi' in joined:
+            return 'fastapi'
+        else:
+            return 'python'
+
+    return project_type
+
+
 class FrameworkDetector:
     """Utility class for detecting project frameworks and adapting accordingly"""
 
@@ -575,67 +963,15 @@ class FrameworkDetector:
         project_type = project_context.get('project_type', 'unknown')
         package_info = project_context.get('package_info', {})
 
-        # JavaScript/Node.js framework detection
-        if project_type == 'javascript/node':
-            deps = package_info.get('dependencies', [])
-            if 'react' in deps:
-                return 'react'
-            elif 'vue' in deps:
-                return 'vue'
-            elif 'angular' in deps:
-                return 'angular'
-            elif 'express' in deps:
-                return 'express'
-            else:
-                return 'javascript'
-
-        # Python framework detection
-        elif project_type == 'python':
-            deps = package_info.get('dependencies', [])
-            if any('flask' in dep.lower() for dep in deps):
-                return 'flask'
-            elif any('django' in dep.lower() for dep in deps):
-                return 'django'
-            elif any('fastapi' in dep.lower() for dep in deps):
-                return 'fastapi'
-            else:
-                return 'python'
+        if project_type not in ('javascript/node', 'python'):
+            return project_type
 
-        return project_type
+        # Detection only depends on which dependencies are present, so sort
+        # them into a stable cache key
+        deps = tuple(sorted(package_info.get('dependencies', [])))
+        return _framework_from_dependencies(project_type, deps)
 
     @staticmethod
-    def get_framework_conventions(framework: str) -> Dict[str, Any]:
+    def get_framework_conventions(framework: str) -> Mapping[str, Any]:
         """Get framework-specific conventions and patterns"""
-        conventions = {
-            'react': {
-                'file_extensions': ['.jsx', '.tsx', '.js', '.ts'],
-                'component_naming': 'PascalCase',
-                'directory_structure': ['src', 'components', 'hooks', 'utils'],
-                'import_style': 'es6'
-            },
-            'vue': {
-                'file_extensions': ['.vue', '.js', '.ts'],
-                'component_naming': 'PascalCase',
-                'directory_structure': ['src', 'components', 'views', 'store'],
-                'import_style': 'es6'
-            },
-            'python': {
-                'file_extensions': ['.py'],
-                'naming_convention': 'snake_case',
-                'directory_structure': ['src', 'tests', 'docs'],
-                'import_style': 'python'
-            },
-            'flask': {
-                'file_extensions': ['.py'],
-                'naming_convention': 'snake_case',
-                'directory_structure': ['app', 'templates', 'static', 'tests'],
-                'import_style': 'python'
-            }
-        }
-
-        return conventions.get(framework, {
-            'file_extensions': ['.txt'],
-            'naming_convention': 'unknown',
-            'directory_structure': [],
-            'import_style': 'unknown'
-        })
+        return _FRAMEWORK_CONVENTIONS.get(framework, _DEFAULT_CONVENTIONS)
@@ -4,16 +4,59 @@ Handles inter-agent messaging, task management, and agent registry
 """
 
 import os
+import re
 import json
-import uuid
+import secrets
+import atexit
 import signal
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Optional
 
 from .models import Task, TaskStatus, AgentRole, Colors
 from .utils import colored_print
 
+try:
+    import fcntl
+except Exception:  # pragma: no cover - fcntl is POSIX only
+    fcntl = None  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except Exception:  # Fallback to the stdlib json module if orjson isn't installed
+    orjson = None  # type: ignore
+
+# How long a parsed comm file is served without re-checking its mtime
+_CACHE_TTL = float(os.getenv("AGENT_COMM_CACHE_TTL", "1.0"))
+
+# Size at which a recipient's append-only message log is folded back into messages.json
+_MESSAGE_LOG_COMPACT_BYTES = 256 * 1024
+
+# Characters not allowed in a per-recipient log file name
+_UNSAFE_NAME_CHARS = re.compile(r'[^\w.-]')
+
+# How long queued registry/task updates are held so bursts share one rewrite
+_FLUSH_INTERVAL = 0.05
+
+# Task states written through immediately: agents are stopped with SIGTERM,
+# which skips atexit, so a queued final status would be lost
+_FINAL_TASK_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED})
+
+
+def _process_start_time(pid: int) -> Optional[int]:
+    """Start time of pid in clock ticks since boot (Linux /proc), or None if unknown"""
+    try:
+        with open(f"/proc/{pid}/stat", 'rb') as f:
+            stat = f.read()
+        # Fields after the parenthesised command name start at field 3; starttime is field 22
+        return int(stat[stat.rfind(b")") + 2:].split()[19])
+    except (OSError, ValueError, IndexError):
+        return None
+
 
 class AgentCommunication:
     """Manages communication between agents via JSON files"""
@@ -27,79 +70,379 @@ class AgentCommunication:
         self.tasks_file = self.comm_dir / "tasks.json"
         self.messages_file = self.comm_dir / "messages.json"
         self.agents_file = self.comm_dir / "agents.json"
+        # New messages are appended to messages/<recipient>.log as JSON lines until compaction
+        self.message_dir = self.comm_dir / "messages"
+        self.message_dir.mkdir(exist_ok=True)
+        
+        # path -> (checked_at, (mtime_ns, size, inode), parsed list)
+        self._cache: Dict[Path, tuple] = {}
+        # Lookup tables derived from the cached lists, rebuilt when those change
+        self._pending_by_assignee: tuple = (None, {})
+        self._agent_index_cache: tuple = (None, {}, {})
+        # Incremental view of each message log: path -> (inode, bytes consumed, parsed messages)
+        self._message_log_state: Dict[Path, tuple] = {}
+        self._messages_by_recipient: tuple = (None, {})
+        # (pid, proc_start) -> (checked_at, alive) for the active-agent sweep
+        self._liveness: Dict[tuple, tuple] = {}
+        
+        # Write-back queue: path -> mutations applied in one locked rewrite
+        self._pending_ops: Dict[Path, List[Callable]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._flush_thread = None
         
-        # Initialize files if they don't exist
+        # Initialize files if they don't exist; exclusive create so an agent
+        # starting up never truncates a file another process just wrote
         for file_path in [self.tasks_file, self.messages_file, self.agents_file]:
-            if not file_path.exists():
-                with open(file_path, 'w') as f:
+            try:
+                with open(file_path, 'x') as f:
                     json.dump([], f)
+            except FileExistsError:
+                pass
+    
+    @contextmanager
+    def _locked(self, path: Path, shared: bool = False):
+        """Hold a cross-process lock around a read-modify-write of path"""
+        if fcntl is None:
+            yield
+            return
+        with open(path.with_name(path.name + ".lock"), 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+    
+    @staticmethod
+    def _read_json(path: Path) -> List[Dict]:
+        """Parse a JSON list file from a single read of its bytes"""
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            if not data:
+                return []
+            if orjson is not None:
+                return orjson.loads(data)
+            return json.loads(data)
+        except (OSError, ValueError):
+            return []
+    
+    def _cached_data(self, path: Path) -> List[Dict]:
+        """Return the shared parsed list for a comm file, re-reading only when it changed"""
+        if path in self._pending_ops:
+            self.flush(path)
+        now = time.monotonic()
+        entry = self._cache.get(path)
+        if entry is not None and now - entry[0] < _CACHE_TTL:
+            return entry[2]
+        try:
+            st = os.stat(path)
+            signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        except OSError:
+            signature = None
+        if entry is not None and signature is not None and entry[1] == signature:
+            self._cache[path] = (now, signature, entry[2])
+            return entry[2]
+        data = self._read_json(path)
+        if signature is not None:
+            self._cache[path] = (now, signature, data)
+        return data
+    
+    def _cached_read(self, path: Path) -> List[Dict]:
+        """Serve a comm file from memory while it is fresh and unchanged on disk"""
+        return list(self._cached_data(path))
+    
+    def _pending_index(self):
+        """Return the cached tasks plus an {assignee: [positions]} index of pending ones"""
+        tasks = self._cached_data(self.tasks_file)
+        if self._pending_by_assignee[0] is not tasks:
+            index: Dict[str, List[int]] = defaultdict(list)
+            for position, task in enumerate(tasks):
+                if task["status"] == TaskStatus.PENDING:
+                    index[task["assigned_to"]].append(position)
+            self._pending_by_assignee = (tasks, index)
+        return self._pending_by_assignee
+    
+    def _agent_index(self):
+        """Return cached {agent_id: agent} and {agent_id: role} maps, the latter for active agents"""
+        agents = self._cached_data(self.agents_file)
+        if self._agent_index_cache[0] is not agents:
+            by_id: Dict[str, Dict] = {}
+            roles: Dict[str, str] = {}
+            for agent in agents:
+                by_id.setdefault(agent["id"], agent)
+                if agent.get("status") == "active":
+                    roles.setdefault(agent["id"], agent["role"])
+            self._agent_index_cache = (agents, by_id, roles)
+        return self._agent_index_cache[1], self._agent_index_cache[2]
+    
+    @staticmethod
+    def _encode(data) -> bytes:
+        """Serialize data as compact, newline-terminated JSON"""
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+        return json.dumps(data, separators=(',', ':')).encode('utf-8') + b"\n"
+    
+    @classmethod
+    def _atomic_write_json(cls, path: Path, data: List[Dict]):
+        """Write data to a private temp file and rename it over path"""
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(cls._encode(data))
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    @staticmethod
+    def _parse_lines(chunk: bytes) -> List[Dict]:
+        """Parse complete JSON lines, skipping any that are damaged"""
+        loads = orjson.loads if orjson is not None else json.loads
+        parsed = []
+        for line in chunk.splitlines():
+            if line:
+                try:
+                    parsed.append(loads(line))
+                except ValueError:
+                    continue
+        return parsed
+    
+    def _message_log_path(self, recipient: str) -> Path:
+        """Append-only log holding messages addressed to recipient"""
+        return self.message_dir / f"{_UNSAFE_NAME_CHARS.sub('_', recipient)}.log"
+    
+    def _read_message_log(self, path: Path) -> List[Dict]:
+        """Return messages appended to a log, reading only bytes not seen before"""
+        inode, offset, messages = self._message_log_state.get(path, (None, 0, []))
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._message_log_state.pop(path, None)
+            return []
+        if st.st_ino != inode or st.st_size < offset:
+            # Log was compacted: the folded messages now live in messages.json
+            self._cache.pop(self.messages_file, None)
+            offset, messages = 0, []
+        if st.st_size > offset:
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                chunk = f.read(st.st_size - offset)
+            complete = chunk.rfind(b"\n") + 1
+            messages = messages + self._parse_lines(chunk[:complete])
+            offset += complete
+        self._message_log_state[path] = (st.st_ino, offset, messages)
+        return messages
+    
+    def _message_logs(self) -> List[Path]:
+        """All per-recipient message logs"""
+        try:
+            return [Path(entry.path) for entry in os.scandir(self.message_dir)
+                    if entry.name.endswith(".log")]
+        except OSError:
+            return []
+    
+    @staticmethod
+    def _reset_message_log(path: Path):
+        """Swap in an empty message log; the caller holds the messages lock exclusively"""
+        tmp_path = path.with_name(path.name + ".tmp")
+        open(tmp_path, 'wb').close()
+        os.replace(tmp_path, path)
+    
+    def _compact_messages(self, path: Path):
+        """Fold a recipient's message log into messages.json"""
+        with self._locked(self.messages_file):
+            try:
+                with open(path, 'rb') as f:
+                    logged = self._parse_lines(f.read())
+            except OSError:
+                return
+            if not logged:
+                return
+            self._atomic_write_json(self.messages_file, self._read_json(self.messages_file) + logged)
+            self._reset_message_log(path)
+        self._cache.pop(self.messages_file, None)
+    
+    def _history_by_recipient(self) -> Dict[str, List[Dict]]:
+        """Return compacted messages.json history grouped by recipient, rebuilt when it changes"""
+        history = self._cached_data(self.messages_file)
+        if self._messages_by_recipient[0] is not history:
+            grouped: Dict[str, List[Dict]] = defaultdict(list)
+            for msg in history:
+                grouped[msg["to"]].append(msg)
+            self._messages_by_recipient = (history, grouped)
+        return self._messages_by_recipient[1]
+    
+    def _queue_update(self, path: Path, mutate: Callable, sync: bool = False):
+        """Queue a mutation of a comm file for the background flusher
+        
+        sync=True writes it (and anything queued before it) before returning.
+        """
+        if sync:
+            with self._pending_lock:
+                self._pending_ops.setdefault(path, []).append(mutate)
+            self.flush(path)
+            return
+        with self._pending_lock:
+            self._pending_ops.setdefault(path, []).append(mutate)
+            if self._flush_thread is None:
+                self._flush_thread = threading.Thread(target=self._flusher, name="agent-comm-flush", daemon=True)
+                self._flush_thread.start()
+                atexit.register(self.flush)
+        self._flush_event.set()
+    
+    def _flusher(self):
+        """Background loop that coalesces queued updates into one write per file"""
+        while True:
+            self._flush_event.wait()
+            time.sleep(_FLUSH_INTERVAL)
+            self._flush_event.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                colored_print(f"Failed to flush agent communication files: {e}", Colors.RED)
+    
+    def flush(self, path: Path = None):
+        """Apply queued updates now, each file under its lock with a single rewrite"""
+        with self._flush_lock:
+            with self._pending_lock:
+                if path is None:
+                    batches, self._pending_ops = self._pending_ops, {}
+                else:
+                    ops = self._pending_ops.pop(path, None)
+                    batches = {path: ops} if ops else {}
+            for target, ops in batches.items():
+                with self._locked(target):
+                    data = self._apply_updates(target, self._read_json(target), ops)
+                    self._atomic_write_json(target, data)
+                self._cache.pop(target, None)
+    
+    def _apply_updates(self, path: Path, data: List[Dict], ops: List[Callable]) -> List[Dict]:
+        """Run queued mutations; agent updates work on a dict keyed by id"""
+        if path == self.agents_file:
+            agents = {agent["id"]: agent for agent in data}
+            for mutate in ops:
+                mutate(agents)
+            return list(agents.values())
+        for mutate in ops:
+            data = mutate(data)
+        return data
     
     # Agent Registry Management
-    def register_agent(self, agent_id: str, role: AgentRole, status: str = "active"):
-        """Register an agent in the system"""
-        agents = self.load_agents()
+    def register_agent(self, agent_id: str, role: AgentRole, status: str = "active", pid: int = None):
+        """Register an agent in the system; pid defaults to the calling process
         
+        Pass the agent's own pid when registering on behalf of another process,
+        since get_active_agents deactivates agents whose pid has exited.
+        """
         # Update or add agent
         agent_info = {
             "id": agent_id,
             "role": role.value,
             "status": status,
             "last_seen": datetime.now().isoformat(),
-            "pid": os.getpid()
+            "pid": os.getpid() if pid is None else pid
         }
+        # Lets liveness checks and kill_agent_by_pid detect a recycled PID
+        proc_start = _process_start_time(agent_info["pid"])
+        if proc_start is not None:
+            agent_info["proc_start"] = proc_start
         
-        # Remove existing entry if any
-        agents = [a for a in agents if a["id"] != agent_id]
-        agents.append(agent_info)
+        def apply(agents: Dict[str, Dict]):
+            # Re-registering moves the agent to the end, as a fresh entry
+            agents.pop(agent_id, None)
+            agents[agent_id] = agent_info
         
-        self.save_agents(agents)
+        self._queue_update(self.agents_file, apply)
         colored_print(f"Agent {agent_id} ({role.value}) registered", Colors.GREEN)
     
     def unregister_agent(self, agent_id: str):
         """Unregister/deactivate an agent"""
-        agents = self.load_agents()
+        deactivated_at = datetime.now().isoformat()
         
-        for agent in agents:
-            if agent["id"] == agent_id:
+        def apply(agents: Dict[str, Dict]):
+            agent = agents.get(agent_id)
+            if agent is not None:
                 agent["status"] = "inactive"
-                agent["deactivated_at"] = datetime.now().isoformat()
-                break
+                agent["deactivated_at"] = deactivated_at
         
-        self.save_agents(agents)
+        self._queue_update(self.agents_file, apply, sync=True)
         colored_print(f"Agent {agent_id} unregistered/deactivated", Colors.YELLOW)
     
     def remove_agent(self, agent_id: str):
         """Completely remove an agent from the system"""
-        agents = self.load_agents()
-        agents = [a for a in agents if a["id"] != agent_id]
-        self.save_agents(agents)
+        self._queue_update(self.agents_file, lambda agents: agents.pop(agent_id, None), sync=True)
         colored_print(f"Agent {agent_id} completely removed", Colors.RED)
     
+    def _is_alive(self, agent: Dict) -> bool:
+        """Probe whether an agent's process still exists, reusing recent answers"""
+        pid = agent.get("pid")
+        if not pid or os.name != "posix":
+            return True
+        key = (pid, agent.get("proc_start"))
+        now = time.monotonic()
+        entry = self._liveness.get(key)
+        if entry is not None and now - entry[0] < _CACHE_TTL:
+            return entry[1]
+        try:
+            os.kill(pid, 0)
+            alive = True
+        except ProcessLookupError:
+            alive = False
+        except OSError:
+            # Exists but belongs to another user
+            alive = True
+        if alive and key[1] is not None:
+            current = _process_start_time(pid)
+            alive = current is None or current == key[1]
+        self._liveness[key] = (now, alive)
+        return alive
+    
     def get_active_agents(self) -> List[Dict]:
-        """Get list of active agents"""
-        agents = self.load_agents()
-        return [agent for agent in agents if agent.get("status") == "active"]
+        """Get list of active agents, marking those whose process is gone as inactive"""
+        active = []
+        dead = {}
+        for agent in self.load_agents():
+            if agent.get("status") == "active":
+                if self._is_alive(agent):
+                    active.append(agent)
+                else:
+                    dead[agent["id"]] = agent.get("pid")
+        
+        if dead:
+            deactivated_at = datetime.now().isoformat()
+            
+            def apply(agents: Dict[str, Dict]):
+                for agent_id, pid in dead.items():
+                    agent = agents.get(agent_id)
+                    if agent is not None and agent.get("pid") == pid and agent.get("status") == "active":
+                        agent["status"] = "inactive"
+                        agent["deactivated_at"] = deactivated_at
+            
+            self._queue_update(self.agents_file, apply)
+        return active
     
     def get_agent_status(self, agent_id: str) -> Dict:
         """Get status of a specific agent"""
-        agents = self.load_agents()
-        for agent in agents:
-            if agent["id"] == agent_id:
-                return agent
-        return None
+        return self._agent_index()[0].get(agent_id)
     
     def load_agents(self) -> List[Dict]:
         """Load agents from JSON file"""
-        try:
-            with open(self.agents_file, 'r') as f:
-                return json.load(f)
-        except:
-            return []
+        return self._cached_read(self.agents_file)
     
     def save_agents(self, agents: List[Dict]):
         """Save agents to JSON file"""
-        with open(self.agents_file, 'w') as f:
-            json.dump(agents, f, indent=2)
+        snapshot = {agent["id"]: agent for agent in agents}
+        
+        def apply(current: Dict[str, Dict]):
+            current.clear()
+            current.update(snapshot)
+        
+        self._queue_update(self.agents_file, apply)
     
     # Process Management
     def kill_agent_by_pid(self, agent_id: str) -> bool:
@@ -112,6 +455,13 @@ class AgentCommunication:
         if not pid:
             return False
         
+        proc_start = agent_info.get("proc_start")
+        if proc_start is not None:
+            current = _process_start_time(pid)
+            if current is not None and current != proc_start:
+                colored_print(f"PID {pid} now belongs to another process; agent {agent_id} is gone", Colors.YELLOW)
+                return False
+        
         try:
             os.kill(pid, signal.SIGTERM)
             colored_print(f"Sent SIGTERM to agent {agent_id} (PID: {pid})", Colors.YELLOW)
@@ -127,7 +477,8 @@ class AgentCommunication:
     def create_task(self, task_type: str, description: str, assigned_to: str, 
                    created_by: str, priority: int = 1, data: Dict = None) -> str:
         """Create a new task"""
-        task_id = str(uuid.uuid4())[:8]
+        task_id = secrets.token_hex(4)
+        now = datetime.now()
         task = Task(
             id=task_id,
             type=task_type,
@@ -137,48 +488,49 @@ class AgentCommunication:
             status=TaskStatus.PENDING,
             priority=priority,
             data=data or {},
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            created_at=now,
+            updated_at=now
         )
         
-        tasks = self.load_tasks()
-        tasks.append(task.to_dict())
-        self.save_tasks(tasks)
+        task_data = task.to_dict()
+        
+        def apply(tasks: List[Dict]) -> List[Dict]:
+            tasks.append(task_data)
+            return tasks
+        
+        self._queue_update(self.tasks_file, apply)
         
         colored_print(f"-- Task created: {task_id} -> {assigned_to}", Colors.BRIGHT_YELLOW)
         return task_id
     
     def update_task_status(self, task_id: str, status: TaskStatus, result: Dict = None):
         """Update task status"""
-        tasks = self.load_tasks()
-        for task in tasks:
-            if task["id"] == task_id:
-                task["status"] = status.value
-                task["updated_at"] = datetime.now().isoformat()
-                if result:
-                    task["result"] = result
-                break
-        self.save_tasks(tasks)
+        updated_at = datetime.now().isoformat()
+        
+        def apply(tasks: List[Dict]) -> List[Dict]:
+            for task in tasks:
+                if task["id"] == task_id:
+                    task["status"] = status.value
+                    task["updated_at"] = updated_at
+                    if result:
+                        task["result"] = result
+                    break
+            return tasks
+        
+        self._queue_update(self.tasks_file, apply, sync=status in _FINAL_TASK_STATUSES)
     
     def get_pending_tasks(self, agent_id: str) -> List[Dict]:
         """Get pending tasks for an agent"""
-        tasks = self.load_tasks()
+        tasks, index = self._pending_index()
         
         # Get agent's role to match against role-based assignments
-        agents = self.get_active_agents()
-        agent_role = None
-        for agent in agents:
-            if agent["id"] == agent_id:
-                agent_role = agent["role"]
-                break
-        
-        # Return tasks assigned to this agent ID OR to this agent's role
-        pending = []
-        for task in tasks:
-            if task["status"] == "pending":
-                assigned_to = task["assigned_to"]
-                if assigned_to == agent_id or (agent_role and assigned_to == agent_role):
-                    pending.append(task)
+        agent_role = self._agent_index()[1].get(agent_id)
+        
+        # Return tasks assigned to this agent ID OR to this agent's role, in file order
+        positions = index.get(agent_id, [])
+        if agent_role and agent_role != agent_id and agent_role in index:
+            positions = sorted(positions + index[agent_role])
+        pending = [tasks[position] for position in positions]
         
         # Only show debug info when there are actual tasks
         if pending and len(pending) > 0:
@@ -190,24 +542,18 @@ class AgentCommunication:
     
     def load_tasks(self) -> List[Dict]:
         """Load tasks from JSON file"""
-        try:
-            with open(self.tasks_file, 'r') as f:
-                return json.load(f)
-        except:
-            return []
+        return self._cached_read(self.tasks_file)
     
     def save_tasks(self, tasks: List[Dict]):
         """Save tasks to JSON file"""
-        with open(self.tasks_file, 'w') as f:
-            json.dump(tasks, f, indent=2)
+        snapshot = list(tasks)
+        self._queue_update(self.tasks_file, lambda _: snapshot)
     
     # Message Management
     def send_message(self, from_agent: str, to_agent: str, message: str, message_type: str = "info"):
         """Send message between agents"""
-        messages = self.load_messages()
-        
         message_data = {
-            "id": str(uuid.uuid4())[:8],
+            "id": secrets.token_hex(4),
             "from": from_agent,
             "to": to_agent,
             "message": message,
@@ -215,23 +561,43 @@ class AgentCommunication:
             "timestamp": datetime.now().isoformat()
         }
         
-        messages.append(message_data)
-        self.save_messages(messages)
+        line = self._encode(message_data)
+        log_path = self._message_log_path(to_agent)
+        # Senders only share the lock: appends to different recipients never contend,
+        # while compaction takes it exclusively
+        with self._locked(self.messages_file, shared=True):
+            fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+                log_size = os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+        if log_size > _MESSAGE_LOG_COMPACT_BYTES:
+            self._compact_messages(log_path)
     
     def get_messages(self, agent_id: str) -> List[Dict]:
         """Get messages for an agent"""
-        messages = self.load_messages()
-        return [msg for msg in messages if msg["to"] == agent_id]
+        log_path = self._message_log_path(agent_id)
+        with self._locked(self.messages_file, shared=True):
+            logged = self._read_message_log(log_path)
+            history = self._history_by_recipient().get(agent_id, [])
+        return history + [msg for msg in logged if msg["to"] == agent_id]
     
     def load_messages(self) -> List[Dict]:
-        """Load messages from JSON file"""
-        try:
-            with open(self.messages_file, 'r') as f:
-                return json.load(f)
-        except:
-            return []
+        """Load messages from the JSON file plus every recipient's append-only log"""
+        with self._locked(self.messages_file, shared=True):
+            logged = []
+            for log_path in self._message_logs():
+                logged.extend(self._read_message_log(log_path))
+            messages = self._cached_data(self.messages_file) + logged
+        # Logs are per recipient and compacted separately; restore send order across them
+        messages.sort(key=lambda msg: msg.get("timestamp", ""))
+        return messages
     
     def save_messages(self, messages: List[Dict]):
         """Save messages to JSON file"""
-        with open(self.messages_file, 'w') as f:
-            json.dump(messages, f, indent=2)
\ No newline at end of file
+        with self._locked(self.messages_file):
+            self._atomic_write_json(self.messages_file, messages)
+            for log_path in self._message_logs():
+                self._reset_message_log(log_path)
+        self._cache.pop(self.messages_file, None)
\ No newline at end of file
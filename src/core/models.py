@@ -2,13 +2,17 @@
 Core data models for the Multi-Agent AI Terminal System
 """
 
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import List, Dict, Any, Optional
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-class AgentRole(Enum):
+
+class AgentRole(str, Enum):
     """Enumeration of available agent roles"""
     COORDINATOR = "coordinator"
     CODER = "coder" 
@@ -21,7 +25,7 @@ class AgentRole(Enum):
     HELPER = "helper"
 
 
-class TaskStatus(Enum):
+class TaskStatus(str, Enum):
     """Enumeration of task statuses"""
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
@@ -49,7 +53,7 @@ class Colors:
     RESET = '\033[0m'  # Alias for ENDC
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Task:
     """Data structure for agent tasks"""
     id: str
@@ -65,6 +69,12 @@ class Task:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert task to dictionary for JSON serialization"""
+        created_at = self.created_at.isoformat()
+        # New tasks share one timestamp; format it only once
+        if self.updated_at == self.created_at:
+            updated_at = created_at
+        else:
+            updated_at = self.updated_at.isoformat()
         return {
             "id": self.id,
             "type": self.type,
@@ -74,8 +84,8 @@ class Task:
             "status": self.status.value,
             "priority": self.priority,
             "data": self.data,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat()
+            "created_at": created_at,
+            "updated_at": updated_at
         }
     
     @classmethod
@@ -95,7 +105,7 @@ class Task:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AgentInfo:
     """Data structure for agent information"""
     id: str
@@ -126,7 +136,7 @@ class AgentInfo:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProjectInfo:
     """Data structure for project information"""
     name: str
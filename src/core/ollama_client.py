@@ -4,20 +4,31 @@ Ollama Client - Supports both local CLI and remote HTTP API access
 
 import os
 import json
+import time
+import asyncio
 import subprocess
+from functools import lru_cache
 try:
     import requests  # type: ignore
 except Exception:  # Fallback if requests isn't installed
     requests = None  # type: ignore
+try:
+    import orjson  # type: ignore
+except Exception:  # Fallback to the stdlib json module if orjson isn't installed
+    orjson = None  # type: ignore
 from typing import Dict, Any, Optional, List
 from .utils import colored_print
 from .models import Colors
 
+# How long availability probes and model listings are reused before re-checking
+_AVAILABILITY_TTL = 5.0
+_MODEL_LIST_TTL = 60.0
+
 
 class OllamaClient:
     """Client that can connect to local or remote Ollama instances"""
 
-    def __init__(self):
+    def __init__(self, verbose: bool = True):
         # Configuration from environment variables
         self.use_remote = os.getenv('OLLAMA_USE_REMOTE', 'false').lower() == 'true'
         self.remote_host = os.getenv('OLLAMA_REMOTE_HOST', 'localhost')
@@ -27,26 +38,68 @@ class OllamaClient:
         self.local_cmd = os.getenv('OLLAMA_CMD', 'ollama')
         self.default_model = os.getenv('OLLAMA_MODEL', 'llama3.2')
 
-        # Construct API base URL
-        self.api_base_url = f"http://{self.remote_host}:{self.remote_port}"
-
-        colored_print(f"Ollama Client initialized:", Colors.CYAN)
+        # Construct API base URL; in local mode this is the local daemon's API,
+        # used in preference to spawning the CLI whenever it answers
         if self.use_remote:
-            colored_print(
-                f"  Mode: Remote API ({self.api_base_url})", Colors.YELLOW
-            )
+            self.api_base_url = f"http://{self.remote_host}:{self.remote_port}"
         else:
-            colored_print(
-                f"  Mode: Local CLI ({self.local_cmd})", Colors.YELLOW
-            )
-        colored_print(f"  Default Model: {self.default_model}", Colors.YELLOW)
+            self.api_base_url = os.getenv('OLLAMA_LOCAL_URL', 'http://127.0.0.1:11434')
+        self._tags_url = f"{self.api_base_url}/api/tags"
+        self._generate_url = f"{self.api_base_url}/api/generate"
+        self._chat_url = f"{self.api_base_url}/api/chat"
+        # Request bodies are copied from these and only the per-call fields filled in
+        self._generate_payload = {'model': None, 'prompt': None, 'stream': False}
+        self._chat_payload = {'model': None, 'messages': None, 'stream': False}
+
+        # One keep-alive connection pool shared by every agent using this client
+        self.session = self._create_session()
+        # key -> (checked_at, value) for the ollama CLI/API probes
+        self._probe_cache: Dict[str, tuple] = {}
+
+        if verbose:
+            colored_print(f"Ollama Client initialized:", Colors.CYAN)
+            if self.use_remote:
+                colored_print(
+                    f"  Mode: Remote API ({self.api_base_url})", Colors.YELLOW
+                )
+            else:
+                colored_print(
+                    f"  Mode: Local CLI ({self.local_cmd})", Colors.YELLOW
+                )
+            colored_print(f"  Default Model: {self.default_model}", Colors.YELLOW)
+
+    def _create_session(self):
+        """Create a pooled HTTP session for the remote API"""
+        if requests is None:
+            return None
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update(self._get_headers())
+        return session
+
+    def _cached_probe(self, key: str, ttl: float, probe, refresh: bool = False):
+        """Reuse a probe result for ttl seconds instead of re-running the CLI/HTTP call"""
+        now = time.monotonic()
+        entry = self._probe_cache.get(key)
+        if not refresh and entry is not None and now - entry[0] < ttl:
+            return entry[1]
+        value = probe()
+        self._probe_cache[key] = (now, value)
+        return value
 
     def is_available(self) -> bool:
         """Check if Ollama (local or remote) is available"""
         if self.use_remote:
-            return self._check_remote_availability()
+            return self._cached_probe('available', _AVAILABILITY_TTL, self._check_remote_availability)
         else:
-            return self._check_local_availability()
+            return self._local_api_available() or self._cached_probe(
+                'available', _AVAILABILITY_TTL, self._check_local_availability)
+
+    def _local_api_available(self) -> bool:
+        """Check (with caching) whether the local daemon's HTTP API answers"""
+        return self._cached_probe('local_api', _AVAILABILITY_TTL, self._check_remote_availability)
 
     def _check_local_availability(self) -> bool:
         """Check if local Ollama is available"""
@@ -63,9 +116,8 @@ class OllamaClient:
         if requests is None:
             return False
         try:
-            response = requests.get(
-                f"{self.api_base_url}/api/tags",
-                headers=self._get_headers(),
+            response = self.session.get(
+                self._tags_url,
                 timeout=5,
             )
             return response.status_code == 200
@@ -79,12 +131,13 @@ class OllamaClient:
             headers['Authorization'] = f'Bearer {self.api_key}'
         return headers
 
-    def list_models(self) -> List[str]:
-        """List available models"""
-        if self.use_remote:
-            return self._list_remote_models()
+    def list_models(self, refresh: bool = False) -> List[str]:
+        """List available models; refresh=True bypasses the cached listing"""
+        if self.use_remote or self._local_api_available():
+            models = self._cached_probe('models', _MODEL_LIST_TTL, self._list_remote_models, refresh)
         else:
-            return self._list_local_models()
+            models = self._cached_probe('models', _MODEL_LIST_TTL, self._list_local_models, refresh)
+        return list(models)
 
     def _list_local_models(self) -> List[str]:
         """List local models"""
@@ -104,9 +157,7 @@ class OllamaClient:
         if requests is None:
             return []
         try:
-            response = requests.get(
-                f"{self.api_base_url}/api/tags", headers=self._get_headers()
-            )
+            response = self.session.get(self._tags_url, timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 return [model['name'] for model in data.get('models', [])]
@@ -120,8 +171,18 @@ class OllamaClient:
 
         if self.use_remote:
             return self._generate_remote(prompt, model, stream)
-        else:
-            return self._generate_local(prompt, model)
+        if self._local_api_available():
+            result = self._generate_remote(prompt, model, stream)
+            if result['success']:
+                return result
+            # Daemon went away or lacks the model: the CLI can still pull/run it
+            self._probe_cache.pop('local_api', None)
+        return self._generate_local(prompt, model)
+
+    async def agenerate(self, prompt: str, model: Optional[str] = None, stream: bool = False) -> Dict[str, Any]:
+        """Async counterpart of generate; gathered calls overlap on the pooled session"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.generate, prompt, model, stream)
 
     def _generate_local(self, prompt: str, model: str) -> Dict[str, Any]:
         """Generate using local Ollama CLI"""
@@ -163,33 +224,32 @@ class OllamaClient:
         if requests is None:
             return {'success': False, 'response': '', 'error': 'requests not installed'}
         try:
-            payload = {
-                'model': model,
-                'prompt': prompt,
-                'stream': stream,
-            }
+            payload = self._generate_payload.copy()
+            payload['model'] = model
+            payload['prompt'] = prompt
+            payload['stream'] = stream
 
-            response = requests.post(
-                f"{self.api_base_url}/api/generate",
+            response = self.session.post(
+                self._generate_url,
                 json=payload,
-                headers=self._get_headers(),
                 timeout=120,
             )
 
             if response.status_code == 200:
                 if stream:
                     # Handle streaming response
-                    full_response = ""
-                    for line in response.iter_lines():
+                    loads = orjson.loads if orjson is not None else json.loads
+                    parts = []
+                    for line in response.iter_lines(chunk_size=8192):
                         if line:
-                            data = json.loads(line)
+                            data = loads(line)
                             if 'response' in data:
-                                full_response += data['response']
+                                parts.append(data['response'])
                             if data.get('done', False):
                                 break
                     return {
                         'success': True,
-                        'response': full_response,
+                        'response': ''.join(parts),
                         'error': None,
                     }
                 else:
@@ -225,26 +285,32 @@ class OllamaClient:
 
         if self.use_remote:
             return self._chat_remote(messages, model)
-        else:
-            # For local CLI, convert to simple prompt
-            prompt = self._convert_messages_to_prompt(messages)
-            return self._generate_local(prompt, model)
+        if self._local_api_available():
+            result = self._chat_remote(messages, model)
+            if result['success']:
+                return result
+            self._probe_cache.pop('local_api', None)
+        # For local CLI, convert to simple prompt
+        prompt = self._convert_messages_to_prompt(messages)
+        return self._generate_local(prompt, model)
+
+    async def achat(self, messages: List[Dict[str, str]], model: Optional[str] = None) -> Dict[str, Any]:
+        """Async counterpart of chat; gathered calls overlap on the pooled session"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.chat, messages, model)
 
     def _chat_remote(self, messages: List[Dict[str, str]], model: str) -> Dict[str, Any]:
         """Chat using remote Ollama API"""
         if requests is None:
             return {'success': False, 'response': '', 'error': 'requests not installed'}
         try:
-            payload = {
-                'model': model,
-                'messages': messages,
-                'stream': False,
-            }
+            payload = self._chat_payload.copy()
+            payload['model'] = model
+            payload['messages'] = messages
 
-            response = requests.post(
-                f"{self.api_base_url}/api/chat",
+            response = self.session.post(
+                self._chat_url,
                 json=payload,
-                headers=self._get_headers(),
                 timeout=120,
             )
 
@@ -285,5 +351,14 @@ class OllamaClient:
         return "\n".join(prompt_parts)
 
 
-# Global instance
-ollama_client = OllamaClient()
+@lru_cache(maxsize=1)
+def get_ollama_client() -> OllamaClient:
+    """Shared client, created on first use rather than at import time"""
+    return OllamaClient()
+
+
+def __getattr__(name: str):
+    # Keeps `from .ollama_client import ollama_client` working without an import-time client
+    if name == 'ollama_client':
+        return get_ollama_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,12 +5,27 @@ Core utility functions for the Multi-Agent AI Terminal System
 import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Union, Any
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union, Any
+try:
+    import orjson  # type: ignore
+except Exception:  # Fallback to the stdlib json module if orjson isn't installed
+    orjson = None  # type: ignore
 
 from .models import Colors
 
+_AGENT_NAME_RE = re.compile(r"^[a-zA-Z0-9_-]+\Z")
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w\-_\.]")
+# Leading "YYYY-MM-DDTHH:MM:SS" of an isoformat() timestamp
+_ISO_TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}", re.ASCII)
+# Stripped import lines; the match ends on the last non-space character
+_PY_IMPORT_RE = re.compile(r"^[^\S\n]*((?:import|from) [^\n]*\S)", re.MULTILINE)
+_JS_IMPORT_RE = re.compile(
+    r"^[^\S\n]*(import [^\n]*\S|const [^\n]*require\((?:[^\n]*\S)?)", re.MULTILINE)
+
 
 def colored_print(text: str, color: str) -> None:
     """Print colored text to terminal"""
@@ -22,20 +37,23 @@ def colored_text(text: str, color: str) -> str:
     return f"{color}{text}{Colors.ENDC}"
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human readable format"""
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size_bytes < 1024.0 or unit == "TB":
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
+    # Each unit spans 10 bits, so the bit length picks it without a loop
+    unit = min((int(size_bytes).bit_length() - 1) // 10, 4)
+    return f"{size_bytes / (1 << (unit * 10)):.1f} {_SIZE_UNITS[unit]}"
 
 
 def validate_agent_name(name: str) -> bool:
     """Validate agent name format"""
     if not name or len(name) < 2:
         return False
-    return bool(re.match(r"^[a-zA-Z0-9_-]+$", name))
+    return bool(_AGENT_NAME_RE.match(name))
 
 
 def validate_file_path(path: str) -> bool:
@@ -58,6 +76,9 @@ def truncate_text(text: str, max_length: int = 100) -> str:
 
 def format_timestamp(timestamp: str) -> str:
     """Format ISO timestamp to readable format"""
+    # isoformat() output already holds the wanted text, no need to parse it
+    if _ISO_TIMESTAMP_RE.match(timestamp):
+        return timestamp[:10] + " " + timestamp[11:19]
     try:
         dt = datetime.fromisoformat(timestamp)
         return dt.strftime("%Y-%m-%d %H:%M:%S")
@@ -67,14 +88,66 @@ def format_timestamp(timestamp: str) -> str:
 
 def safe_filename(filename: str) -> str:
     """Convert string to safe filename"""
-    safe_name = re.sub(r"[^\w\-_\.]", "_", filename)
-    return safe_name[:100]
+    return _UNSAFE_FILENAME_RE.sub("_", filename)[:100]
+
+
+def compile_keyword_ranker(table: Sequence[Tuple[Any, Iterable[str]]]) -> Callable[[str], Optional[Any]]:
+    """Build a matcher returning the first value in table whose keywords occur in a text
+
+    table holds (value, keywords) pairs in priority order. The matcher does a
+    single regex scan instead of one substring check per keyword and returns
+    None when no keyword occurs.
+    """
+    rank: Dict[str, int] = {}
+    for index, (_, keywords) in enumerate(table):
+        for keyword in keywords:
+            rank.setdefault(keyword, index)
+    values = [value for value, _ in table]
+
+    # The lookahead reports overlapping hits, and with the alternatives in
+    # priority order the hit at each position is the best keyword starting there
+    pattern = re.compile(
+        "(?=(" + "|".join(re.escape(k) for k in sorted(rank, key=lambda k: (rank[k], k))) + "))")
+
+    def best_match(text: str) -> Optional[Any]:
+        best = len(values)
+        for match in pattern.finditer(text):
+            index = rank[match.group(1)]
+            if index < best:
+                best = index
+                if index == 0:
+                    break
+        return values[best] if best < len(values) else None
+
+    return best_match
+
+
+# Characters of file content kept as a prompt preview
+FILE_PREVIEW_CHARS = 1000
+
+# Leading bytes checked for NUL before a file is read and decoded as text
+_BINARY_SNIFF_BYTES = 4096
+
+
+def read_utf8_text(file_path: Path) -> str:
+    """Read a file like open(path, 'r', encoding='utf-8'), failing fast on binary content"""
+    with open(file_path, "rb") as f:
+        head = f.read(_BINARY_SNIFF_BYTES)
+        nul = head.find(b"\x00")
+        if nul != -1:
+            raise UnicodeDecodeError("utf-8", head, nul, nul + 1, "NUL byte in a text file")
+        data = head + f.read()
+    content = data.decode("utf-8")
+    # Same universal-newline translation text mode applies
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
 
 
 def gather_file_context(
-    file_path: Union[str, Path], max_size: int = 50000
+    file_path: Union[str, Path], max_size: int = 50000, full: bool = True
 ) -> Dict[str, Union[str, int, bool, Dict, List]]:
-    """Gather comprehensive context about a file"""
+    """Gather comprehensive context about a file; full=False keeps only a content preview"""
     file_path = Path(file_path)
 
     if not file_path.exists():
@@ -100,9 +173,11 @@ def gather_file_context(
         # Try to read file content if it's not too large
         if stat.st_size <= max_size:
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                context["content"] = content
+                content = read_utf8_text(file_path)
+                if full:
+                    context["content"] = content
+                context["preview"] = content[:FILE_PREVIEW_CHARS]
+                context["content_truncated"] = len(content) > FILE_PREVIEW_CHARS
                 context["readable"] = True
                 context["lines"] = len(content.splitlines())
                 context["characters"] = len(content)
@@ -117,11 +192,7 @@ def gather_file_context(
                     context["imports"] = _extract_js_imports(content)
                 elif suffix == ".json":
                     context["file_type"] = "json"
-                    try:
-                        json.loads(content)
-                        context["valid_json"] = True
-                    except json.JSONDecodeError:
-                        context["valid_json"] = False
+                    context["valid_json"] = _is_valid_json(content)
 
             except UnicodeDecodeError:
                 context["readable"] = False
@@ -143,6 +214,34 @@ def gather_file_context(
         }
 
 
+# Entries never included in directory scans
+_SCAN_EXCLUDES = frozenset({"__pycache__", "node_modules", ".git", ".vscode", "venv", ".env"})
+
+# Small files with these extensions get their content inlined in directory scans
+_PREVIEW_EXTENSIONS = frozenset({".py", ".js", ".ts", ".json", ".md", ".txt", ".yml", ".yaml"})
+
+_ENTRY_NAME = attrgetter("name")
+
+# Preview reads are I/O bound; threads overlap them once a scan has a few
+_READ_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4), thread_name_prefix="context-read")
+_PARALLEL_READ_MIN = 4
+
+
+def _read_text(path: str) -> Optional[str]:
+    """Read a small UTF-8 text file, or None if it can't be read"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except Exception:
+        return None
+
+
+def _suffix(name: str) -> str:
+    """Path(name).suffix without building a Path"""
+    i = name.rfind(".")
+    return name[i:] if 0 < i < len(name) - 1 else ""
+
+
 def gather_directory_context(dir_path: Union[str, Path]) -> Dict[str, Union[str, int, List, bool, Dict]]:
     """Gather comprehensive context about a directory"""
     dir_path = Path(dir_path)
@@ -164,9 +263,12 @@ def gather_directory_context(dir_path: Union[str, Path]) -> Dict[str, Union[str,
 
     try:
         file_count = 0
+        # (file_info, path) of small text files whose content is read after the walk
+        pending_reads: List[tuple] = []
 
         def _scan_directory(
-            current_path: Path,
+            current_path: Union[str, Path],
+            rel_path: str = "",
             current_depth: int = 0,
             max_depth: int = 3,
             max_files: int = 100,
@@ -178,63 +280,52 @@ def gather_directory_context(dir_path: Union[str, Path]) -> Dict[str, Union[str,
 
             items: List[Dict[str, Any]] = []
             try:
-                for item in sorted(current_path.iterdir()):
+                # One scandir pass yields name and type together; each file is
+                # stat'ed once
+                with os.scandir(current_path) as it:
+                    entries = sorted(it, key=_ENTRY_NAME)
+
+                for entry in entries:
+                    name = entry.name
                     # Skip hidden files and common excludes
-                    if item.name.startswith(".") or item.name in [
-                        "__pycache__",
-                        "node_modules",
-                        ".git",
-                        ".vscode",
-                        "venv",
-                        ".env",
-                    ]:
+                    if name.startswith(".") or name in _SCAN_EXCLUDES:
                         continue
 
-                    if item.is_file():
+                    if entry.is_file():
                         file_count += 1
                         if file_count > max_files:
                             break
 
+                        size = entry.stat().st_size
+                        extension = _suffix(name).lower()
                         file_info: Dict[str, Any] = {
-                            "name": item.name,
+                            "name": name,
                             "type": "file",
-                            "size": item.stat().st_size,
-                            "size_formatted": format_file_size(item.stat().st_size),
-                            "extension": item.suffix.lower(),
-                            "path": str(item.relative_to(dir_path)),
+                            "size": size,
+                            "size_formatted": format_file_size(size),
+                            "extension": extension,
+                            "path": os.path.join(rel_path, name),
                         }
 
                         # Add content preview for small text files
-                        if item.suffix.lower() in [
-                            ".py",
-                            ".js",
-                            ".ts",
-                            ".json",
-                            ".md",
-                            ".txt",
-                            ".yml",
-                            ".yaml",
-                        ]:
-                            if item.stat().st_size < 10000:  # Only small files
-                                try:
-                                    with open(item, "r", encoding="utf-8") as f:
-                                        file_info["content"] = f.read()
-                                except Exception:
-                                    file_info["content"] = None
+                        if extension in _PREVIEW_EXTENSIONS:
+                            if size < 10000:  # Only small files
+                                pending_reads.append((file_info, entry.path))
 
                         items.append(file_info)
 
-                    elif item.is_dir() and current_depth < max_depth:
+                    elif entry.is_dir() and current_depth < max_depth:
                         dir_info: Dict[str, Any] = {
-                            "name": item.name,
+                            "name": name,
                             "type": "directory",
-                            "path": str(item.relative_to(dir_path)),
+                            "path": os.path.join(rel_path, name),
                             "children": [],
                         }
 
                         # Recursively scan subdirectory
                         subdir_items = _scan_directory(
-                            item, current_depth + 1, max_depth, max_files
+                            entry.path, os.path.join(rel_path, name),
+                            current_depth + 1, max_depth, max_files
                         )
                         if subdir_items:
                             dir_info["children"] = subdir_items
@@ -252,6 +343,14 @@ def gather_directory_context(dir_path: Union[str, Path]) -> Dict[str, Union[str,
 
         structure = _scan_directory(dir_path)
 
+        paths = [path for _, path in pending_reads]
+        if len(paths) >= _PARALLEL_READ_MIN:
+            contents = _READ_POOL.map(_read_text, paths)
+        else:
+            contents = map(_read_text, paths)
+        for (file_info, _), content in zip(pending_reads, contents):
+            file_info["content"] = content
+
         return {
             "path": str(dir_path),
             "exists": True,
@@ -285,22 +384,25 @@ def gather_project_context(project_path: Union[str, Path]) -> Dict[str, Union[st
         "exists": True,
     }
 
+    # One listing of the project root answers every existence check below
+    names, dirs = _scan_project_root(project_path)
+
     # Detect project type and gather metadata
-    project_type = _detect_project_type(project_path)
+    project_type = _detect_project_type(names)
     context["project_type"] = project_type
 
     # Gather package information
-    package_info = _gather_package_info(project_path, project_type)
+    package_info = _gather_package_info(project_path, project_type, names)
     if package_info:
         context["package_info"] = package_info
 
     # Look for common configuration files
-    config_files = _find_config_files(project_path)
+    config_files = _find_config_files(names)
     if config_files:
         context["config_files"] = config_files
 
     # Analyze project structure
-    structure_analysis = _analyze_project_structure(project_path, project_type)
+    structure_analysis = _analyze_project_structure(names, dirs, project_type)
     context.update(structure_analysis)
 
     return context
@@ -308,22 +410,12 @@ def gather_project_context(project_path: Union[str, Path]) -> Dict[str, Union[st
 
 def _extract_python_imports(content: str) -> List[str]:
     """Extract import statements from Python content"""
-    imports: List[str] = []
-    for line in content.splitlines():
-        s = line.strip()
-        if s.startswith("import ") or s.startswith("from "):
-            imports.append(s)
-    return imports
+    return _PY_IMPORT_RE.findall(content)
 
 
 def _extract_js_imports(content: str) -> List[str]:
     """Extract import statements from JavaScript/TypeScript content"""
-    imports: List[str] = []
-    for line in content.splitlines():
-        s = line.strip()
-        if s.startswith("import ") or (s.startswith("const ") and "require(" in s):
-            imports.append(s)
-    return imports
+    return _JS_IMPORT_RE.findall(content)
 
 
 def _calculate_directory_size(dir_path: Path) -> Dict[str, Union[int, str]]:
@@ -332,10 +424,26 @@ def _calculate_directory_size(dir_path: Path) -> Dict[str, Union[int, str]]:
     file_count = 0
 
     try:
-        for item in dir_path.rglob("*"):
-            if item.is_file():
-                file_count += 1
-                total_size += item.stat().st_size
+        # Iterative scandir walk; like rglob it skips unreadable directories
+        # and doesn't descend into symlinked ones. Entries that vanish mid-walk
+        # (agents replace files in the workspace all the time) are skipped
+        stack = [dir_path]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    try:
+                        if entry.is_dir() and not entry.is_symlink():
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            size = entry.stat().st_size
+                            file_count += 1
+                            total_size += size
+                    except OSError:
+                        continue
     except Exception:
         return {"error": "Could not calculate directory size"}
 
@@ -346,33 +454,72 @@ def _calculate_directory_size(dir_path: Path) -> Dict[str, Union[int, str]]:
     }
 
 
-def _detect_project_type(project_path: Path) -> str:
+def _scan_project_root(project_path: Path) -> Tuple[Set[str], Set[str]]:
+    """List the names that exist in the project root and which of them are directories"""
+    names: Set[str] = set()
+    dirs: Set[str] = set()
+    try:
+        with os.scandir(project_path) as it:
+            for entry in it:
+                try:
+                    # Like Path.exists()/is_dir(): follow symlinks, drop dangling ones
+                    if entry.is_symlink() and not os.path.exists(entry.path):
+                        continue
+                    names.add(entry.name)
+                    if entry.is_dir():
+                        dirs.add(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return names, dirs
+
+
+def _detect_project_type(names: Set[str]) -> str:
     """Detect the type of project based on files present"""
-    if (project_path / "package.json").exists():
+    if "package.json" in names:
         return "javascript/node"
-    if (project_path / "requirements.txt").exists() or (project_path / "setup.py").exists():
+    if "requirements.txt" in names or "setup.py" in names:
         return "python"
-    if (project_path / "pyproject.toml").exists():
+    if "pyproject.toml" in names:
         return "python"
-    if (project_path / "Cargo.toml").exists():
+    if "Cargo.toml" in names:
         return "rust"
-    if (project_path / "pom.xml").exists():
+    if "pom.xml" in names:
         return "java/maven"
-    if (project_path / "build.gradle").exists():
+    if "build.gradle" in names:
         return "java/gradle"
-    if (project_path / "composer.json").exists():
+    if "composer.json" in names:
         return "php"
     return "unknown"
 
 
-def _gather_package_info(project_path: Path, project_type: str) -> Optional[Dict]:
+def _is_valid_json(content: str) -> bool:
+    """Check whether content parses as JSON"""
+    if orjson is not None:
+        try:
+            orjson.loads(content)
+            return True
+        except orjson.JSONDecodeError:
+            pass  # json also accepts NaN/Infinity and big ints, let it decide
+    try:
+        json.loads(content)
+        return True
+    except json.JSONDecodeError:
+        return False
+
+
+def _gather_package_info(project_path: Path, project_type: str, names: Set[str]) -> Optional[Dict]:
     """Gather package/dependency information"""
     try:
         if project_type == "javascript/node":
-            package_json = project_path / "package.json"
-            if package_json.exists():
-                with open(package_json, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+            if "package.json" in names:
+                package_json = project_path / "package.json"
+                if orjson is not None:
+                    data = orjson.loads(package_json.read_bytes())
+                else:
+                    with open(package_json, "r", encoding="utf-8") as f:
+                        data = json.load(f)
                 return {
                     "name": data.get("name", ""),
                     "version": data.get("version", ""),
@@ -381,9 +528,8 @@ def _gather_package_info(project_path: Path, project_type: str) -> Optional[Dict
                 }
         elif project_type == "python":
             # Try requirements.txt first
-            requirements_txt = project_path / "requirements.txt"
-            if requirements_txt.exists():
-                with open(requirements_txt, "r", encoding="utf-8") as f:
+            if "requirements.txt" in names:
+                with open(project_path / "requirements.txt", "r", encoding="utf-8") as f:
                     deps = [
                         line.split("==")[0].split(">=")[0].strip()
                         for line in f.readlines()
@@ -395,8 +541,7 @@ def _gather_package_info(project_path: Path, project_type: str) -> Optional[Dict
                 }
 
             # Try pyproject.toml (without parsing to avoid extra deps)
-            pyproject_toml = project_path / "pyproject.toml"
-            if pyproject_toml.exists():
+            if "pyproject.toml" in names:
                 return {"source": "pyproject.toml", "dependencies": []}
     except Exception:
         pass
@@ -404,7 +549,7 @@ def _gather_package_info(project_path: Path, project_type: str) -> Optional[Dict
     return None
 
 
-def _find_config_files(project_path: Path) -> List[str]:
+def _find_config_files(names: Set[str]) -> List[str]:
     """Find common configuration files in project"""
     config_patterns = [
         ".env",
@@ -427,16 +572,12 @@ def _find_config_files(project_path: Path) -> List[str]:
         ".prettierrc",
     ]
 
-    found_configs: List[str] = []
-    for pattern in config_patterns:
-        config_file = project_path / pattern
-        if config_file.exists():
-            found_configs.append(pattern)
-
-    return found_configs
+    return [pattern for pattern in config_patterns if pattern in names]
 
 
-def _analyze_project_structure(project_path: Path, project_type: str) -> Dict[str, Union[List, bool]]:
+def _analyze_project_structure(
+    names: Set[str], dirs: Set[str], project_type: str
+) -> Dict[str, Union[List, bool]]:
     """Analyze project structure for common patterns"""
     analysis: Dict[str, Union[List, bool]] = {}
 
@@ -453,38 +594,32 @@ def _analyze_project_structure(project_path: Path, project_type: str) -> Dict[st
         "public",
         "static",
     ]
-    found_dirs: List[str] = []
-
-    for dir_name in common_dirs:
-        if (project_path / dir_name).is_dir():
-            found_dirs.append(dir_name)
-
-    analysis["common_directories"] = found_dirs
+    analysis["common_directories"] = [dir_name for dir_name in common_dirs if dir_name in dirs]
 
     # Check for testing setup
     has_tests = any(
-        (project_path / test_dir).exists() for test_dir in ["tests", "test", "__tests__"]
+        test_dir in names for test_dir in ["tests", "test", "__tests__"]
     )
     analysis["has_tests"] = has_tests
 
     # Check for documentation
     has_docs = any(
-        (project_path / doc_file).exists() for doc_file in ["README.md", "README.rst", "docs"]
+        doc_file in names for doc_file in ["README.md", "README.rst", "docs"]
     )
     analysis["has_documentation"] = has_docs
 
     # Type-specific analysis
     if project_type == "javascript/node":
-        analysis["has_typescript"] = (project_path / "tsconfig.json").exists()
+        analysis["has_typescript"] = "tsconfig.json" in names
         analysis["has_eslint"] = any(
-            (project_path / eslint_file).exists()
+            eslint_file in names
             for eslint_file in [".eslintrc.js", ".eslintrc.json", ".eslintrc.yml"]
         )
     elif project_type == "python":
         analysis["has_virtual_env"] = any(
-            (project_path / venv_dir).exists() for venv_dir in ["venv", ".venv", "env", ".env"]
+            venv_dir in names for venv_dir in ["venv", ".venv", "env", ".env"]
         )
-        analysis["has_setup_py"] = (project_path / "setup.py").exists()
-        analysis["has_pyproject_toml"] = (project_path / "pyproject.toml").exists()
+        analysis["has_setup_py"] = "setup.py" in names
+        analysis["has_pyproject_toml"] = "pyproject.toml" in names
 
     return analysis
\ No newline at end of file
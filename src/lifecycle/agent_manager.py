@@ -140,7 +140,9 @@ class AgentLifecycleManager:
             except ValueError:
                 agent_role = AgentRole.GENERAL
             
-            self.comm.register_agent(agent_id, agent_role, "active")
+            # Registered under the child's pid so the agent stays active after
+            # this manager exits
+            self.comm.register_agent(agent_id, agent_role, "active", pid=process.pid)
             
             colored_print(f"   SUCCESS: Agent '{agent_id}' spawned with PID {process.pid}", Colors.GREEN)
             
@@ -0,0 +1,81 @@
+"""
+Tests for the testing agent's sharded pytest runs
+"""
+
+import importlib.util
+import sys
+import types
+
+import pytest
+
+from src.agents import tester
+
+
+@pytest.fixture
+def agent(tmp_path, monkeypatch):
+    """Testing agent over a workspace holding a single passing test file"""
+    monkeypatch.setenv("TESTER_QUIET", "1")
+    (tmp_path / "test_one.py").write_text("def test_one():\n    assert True\n")
+    return tester.TestingAgent(types.SimpleNamespace(workspace_dir=str(tmp_path)), None)
+
+
+def _pytest(*args):
+    return [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", *args]
+
+
+def test_empty_shards_do_not_fail_the_run(agent):
+    result = agent._run_sharded([_pytest("test_one.py"), _pytest("test_one.py", "-k", "no_such_test")])
+    assert result.returncode == 0
+
+
+def test_failing_shard_fails_the_run(agent, tmp_path):
+    (tmp_path / "test_two.py").write_text("def test_two():\n    assert False\n")
+    result = agent._run_sharded([_pytest("test_one.py", "-k", "no_such_test"), _pytest("test_two.py")])
+    assert result.returncode == 1
+
+
+def test_no_tests_collected_anywhere(agent):
+    result = agent._run_sharded([_pytest("test_one.py", "-k", "no_such_test")] * 2)
+    assert result.returncode == 5
+
+
+@pytest.mark.skipif(importlib.util.find_spec("pytest_split") is None, reason="pytest-split not installed")
+def test_single_test_file_suite_passes(agent):
+    assert tester._WORKERS > 1
+    result = agent.run_pytest_tests()
+    assert result["tests_passed"], result
+
+
+def _js_agent(tmp_path, monkeypatch, files):
+    monkeypatch.setenv("TESTER_QUIET", "1")
+    (tmp_path / "package.json").write_text('{"devDependencies": {"jest": "29"}}')
+    for name in files:
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text("")
+    return tester.TestingAgent(types.SimpleNamespace(workspace_dir=str(tmp_path)), None)
+
+
+@pytest.mark.parametrize("files", [
+    ["scripts/build_icons.py"],
+    ["requirements.txt", "pyproject.toml", "setup.cfg"],
+    ["tests/app.test.js"],
+])
+def test_stray_python_files_do_not_add_pytest(tmp_path, monkeypatch, files):
+    assert tester.TestingAgent._detect_all_frameworks(_js_agent(tmp_path, monkeypatch, files)) == ["jest"]
+
+
+@pytest.mark.parametrize("files", [
+    ["scripts/test_icons.py"],
+    ["py/icons_test.py"],
+    ["tests/conftest.py"],
+])
+def test_python_tests_add_pytest(tmp_path, monkeypatch, files):
+    assert tester.TestingAgent._detect_all_frameworks(_js_agent(tmp_path, monkeypatch, files)) == ["jest", "pytest"]
+
+
+def test_empty_pytest_run_is_not_a_failure(tmp_path, monkeypatch):
+    agent = _js_agent(tmp_path, monkeypatch, [])
+    monkeypatch.setattr(agent, "run_jest_tests", lambda: {"status": "success"})
+    monkeypatch.setattr(agent, "run_pytest_tests", lambda fail_fast=False: {"status": "failed", "return_code": 5})
+    result = agent._run_frameworks_concurrently(["jest", "pytest"])
+    assert result["tests_passed"] and result["framework"] == "jest", result